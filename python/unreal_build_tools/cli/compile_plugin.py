@@ -1,16 +1,11 @@
 from __future__ import absolute_import, unicode_literals
 import argparse
 import sys
-import traceback
+from contextlib import nullcontext
 from pathlib import Path
 
 from unreal_build_tools.core.logging import setup_logger
-from unreal_build_tools.core.platform_utils import get_platform, get_engine_path
-from unreal_build_tools.core.filesystem import find_uplugin, temporary_directory
-from unreal_build_tools.core.structs import CompilerConfig
 from unreal_build_tools.core.exceptions import UnrealBuildToolsError
-from unreal_build_tools.impl.plugin_compiler import PluginCompiler
-from unreal_build_tools.cli.inputs import select_ue_version
 
 logger = setup_logger(__name__)
 
@@ -26,6 +21,11 @@ def parse_args() -> argparse.Namespace:
         type=Path,
         help='Output directory for compiled plugin'
     )
+    parser.add_argument(
+        '--compile-timeout',
+        type=float,
+        help='Abort the build if it runs longer than this many seconds'
+    )
     parser.add_argument(
         '--verbose', '-v',
         action='store_true',
@@ -39,6 +39,13 @@ def main() -> int:
         if args.verbose:
             logger.setLevel("DEBUG")
 
+        # Imported after parsing so --help and argument errors stay fast
+        from unreal_build_tools.core.platform_utils import get_platform, get_engine_path
+        from unreal_build_tools.core.filesystem import find_uplugin, temporary_directory
+        from unreal_build_tools.core.structs import CompilerConfig
+        from unreal_build_tools.impl.plugin_compiler import PluginCompiler
+        from unreal_build_tools.cli.inputs import select_ue_version
+
         plugin_path = find_uplugin(args.plugin)
         logger.info(f"Compiling plugin: {plugin_path}")
 
@@ -51,42 +58,44 @@ def main() -> int:
             
         engine_path = get_engine_path(engine_version)
         
-        # Set up base compiler config
-        config = CompilerConfig(
-            platform=platform,
-            engine_path=engine_path,
-            source=plugin_path,
-            output_dir=args.output,
-        )
-        # These are separate because if no output_dir is specified, we need to use a temporary directory
+        # Without an output directory the build goes to a fresh temporary
+        # directory, which needs no preparation and is removed afterwards
         if args.output:
-            logger.info(f"Output directory: {config.output_dir}")
-            
+            logger.info(f"Output directory: {args.output}")
+            output_context = nullcontext(args.output)
+        else:
+            output_context = temporary_directory()
+
+        with output_context as output_dir:
+            config = CompilerConfig(
+                platform=platform,
+                engine_path=engine_path,
+                source=plugin_path,
+                output_dir=output_dir,
+                timeout=args.compile_timeout,
+            )
             compiler = PluginCompiler(config)
             success = compiler.run()
-        else:
-            with temporary_directory() as temp_dir:
-                config.output_dir = temp_dir
-                
-                compiler = PluginCompiler(config)
-                success = compiler.run()
                 
         if not success:
             raise UnrealBuildToolsError("Plugin compilation failed")
             
-        logger.info(
-            "Plugin compiled successfully in temporary directory. "
-            "Use --output to specify a permanent location."
-        )
+        if args.output:
+            logger.info("Plugin compiled successfully")
+        else:
+            logger.info(
+                "Plugin compiled successfully in temporary directory. "
+                "Use --output to specify a permanent location."
+            )
         
         return 0
 
     except UnrealBuildToolsError as e:
-        traceback.print_exc()
+        logger.debug("Traceback:", exc_info=True)
         logger.error(str(e))
         return 1
     except Exception as e:
-        traceback.print_exc()
+        # logger.exception already includes the traceback
         logger.exception("Unexpected error occurred")
         return 1
 
@@ -10,6 +10,8 @@ from unreal_build_tools.core.logging import setup_logger
 
 from typing import List, Optional
 from pathlib import Path
+import os
+import stat
 
 logger = setup_logger(__name__)
 
@@ -32,6 +34,11 @@ def select_ue_version(versions: Optional[List[str]], base_path: Optional[Path]=N
         logger.error("No UE installations found!")
         raise RuntimeError("No UE installations found!")
 
+    # Nothing to choose between, don't block on stdin
+    if len(versions) == 1:
+        logger.info(f"Using UE {versions[0]}")
+        return versions[0]
+
     logger.info("Available UE versions:")
     for idx, version in enumerate(versions, 1):
         logger.info(f"{idx}. {version}")
@@ -62,24 +69,39 @@ def find_uplugin(path: Optional[str] = None) -> Path:
         RuntimeError: If plugin file is not found or multiple plugins exist
     """
     if path:
-        plugin_path = Path(path)
-        if plugin_path.is_file():
+        try:
+            # One stat answers both whether the path exists and what it is
+            mode = os.stat(path).st_mode
+        except OSError:
+            logger.error(f"Invalid path: {path}")
+            raise RuntimeError(f"Invalid path: {path}")
+        plugin_path = Path(path).resolve()
+        if stat.S_ISREG(mode):
             if plugin_path.suffix != ".uplugin":
                 logger.error(f"Invalid file type: {plugin_path}")
                 raise RuntimeError(f"Invalid file type: {plugin_path}")
             logger.debug(f"Using specified plugin file: {plugin_path}")
-            return plugin_path.resolve()
-        elif plugin_path.is_dir():
+            return plugin_path
+        elif stat.S_ISDIR(mode):
             directory = plugin_path
             logger.debug(f"Searching for plugins in directory: {directory}")
         else:
             logger.error(f"Invalid path: {plugin_path}")
             raise RuntimeError(f"Invalid path: {plugin_path}")
     else:
-        directory = Path.cwd()
+        directory = Path.cwd().resolve()
         logger.debug("Searching for plugins in current directory")
 
-    plugins = list(directory.glob("*.uplugin"))
+    # Only two matches are needed to tell none, one or many apart. Like the
+    # glob this replaces, the suffix is matched case-insensitively on Windows.
+    plugins = []
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            name = entry.name.lower() if os.name == "nt" else entry.name
+            if name.endswith(".uplugin") and entry.is_file():
+                plugins.append(entry.path)
+                if len(plugins) > 1:
+                    break
     if not plugins:
         logger.error("No .uplugin file found in current directory")
         raise RuntimeError("No .uplugin file found in current directory")
@@ -87,6 +109,7 @@ def find_uplugin(path: Optional[str] = None) -> Path:
         logger.error("Multiple .uplugin files found. Please specify one.")
         raise RuntimeError("Multiple .uplugin files found. Please specify one.")
     
-    plugin_path = plugins[0]
+    # directory is already resolved, so the match is too
+    plugin_path = Path(plugins[0])
     logger.info(f"Found plugin file: {plugin_path}")
-    return plugin_path.resolve()
+    return plugin_path
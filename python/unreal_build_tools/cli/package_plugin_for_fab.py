@@ -2,27 +2,14 @@
 """CLI tool for packaging Forum Asset Bundle (FAB) plugins."""
 
 import argparse
-import json
 import logging
-import shutil
 import sys
-import tempfile
-import traceback
 from pathlib import Path
 from typing import List, Optional
-from contextlib import contextmanager
-
-from unreal_build_tools.core.structs import PluginInfo, CompilerConfig
-from unreal_build_tools.core.filesystem import find_uplugin, temporary_directory
-from unreal_build_tools.core.platform_utils import get_engine_path, get_platform
-from unreal_build_tools.impl.validators.fab_plugin_uplugin_validator import FabPluginUpluginValidator
-from unreal_build_tools.impl.validators.fab_plugin_path_validator import FabPluginPathValidator
-from unreal_build_tools.impl.validators.fab_plugin_copyright_validator import FabPluginCopyrightValidator
-from unreal_build_tools.impl.validators.fab_plugin_executables_validator import FabPluginNoExecutablesValidator
-from unreal_build_tools.impl.plugin_compiler import PluginCompiler
-from unreal_build_tools.core.exceptions import ValidationError, BuildError, ConfigurationError
-from unreal_build_tools.packaging import package_version_for_fab
-from unreal_build_tools.staging import stage_plugin_files
+
+# Everything else is imported where it is used, so --help and argument
+# errors do not pay for loading the whole packaging pipeline
+from unreal_build_tools.core.structs import PluginInfo, ValidationResult
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(message)s')
@@ -32,72 +19,129 @@ DEFAULT_VERSIONS = ["4.27", "5.0", "5.1", "5.2", "5.3", "5.4", "5.5"]
 
 # TODO: Move these functions to a module
 
-def validate_plugin(plugin_info: PluginInfo, engine_path: Optional[Path] = None) -> bool:
-    """Run all plugin validations."""
-    validators = [
-        FabPluginUpluginValidator(plugin_info),
+def run_validators(plugin_info: PluginInfo) -> List[ValidationResult]:
+    """Run the FAB validators over a plugin."""
+    from unreal_build_tools.impl.validators.fab_plugin_uplugin_validator import FabPluginUpluginValidator
+    from unreal_build_tools.impl.validators.fab_plugin_path_validator import FabPluginPathValidator
+    from unreal_build_tools.impl.validators.fab_plugin_copyright_validator import FabPluginCopyrightValidator
+    from unreal_build_tools.impl.validators.fab_plugin_executables_validator import FabPluginNoExecutablesValidator
+    from unreal_build_tools.impl.validators.fused_file_validator import FusedFileValidator
+
+    # The per-file validators share a single walk of the plugin
+    file_validators = FusedFileValidator(plugin_info, [
         FabPluginPathValidator(plugin_info),
         FabPluginCopyrightValidator(plugin_info),
         FabPluginNoExecutablesValidator(plugin_info)
-    ]
+    ])
+    results = [FabPluginUpluginValidator(plugin_info).validate()]
+    results.extend(file_validators.validate())
+    return results
+
+def validate_plugin(
+    plugin_info: PluginInfo,
+    engine_path: Optional[Path] = None,
+    compile_timeout: Optional[float] = None,
+    use_cache: bool = True
+) -> bool:
+    """Run all plugin validations.
+    
+    Args:
+        plugin_info (PluginInfo): Plugin to validate
+        engine_path (Optional[Path], optional): Engine to validate compilation
+            against. Defaults to None, which skips the compilation check.
+        compile_timeout (Optional[float], optional): Seconds before the
+            validation build is aborted. Defaults to None.
+        use_cache (bool, optional): Reuse results from an earlier run over an
+            identical tree. Defaults to True. Compilation is never cached.
+    """
+    from unreal_build_tools.core import validation_cache
+
+    results = None
+    if use_cache:
+        signature = validation_cache.tree_signature(plugin_info.source_dir)
+        results = validation_cache.load_results(signature)
+        if results is not None:
+            logger.info("Plugin files unchanged, using cached validation results")
+    if results is None:
+        results = run_validators(plugin_info)
+        if use_cache:
+            validation_cache.store_results(signature, results)
     
     success = True
-    for validator in validators:
-        result = validator.validate()
+    for result in results:
         if not result.success:
             success = False
-            logger.error(f"\n{result.name} failed:")
+            logger.error("\n%s failed:", result.name)
             for error in result.errors:
-                logger.error(f"  ✗ {error}")
+                logger.error("  ✗ %s", error)
             for warning in result.warnings:
-                logger.warning(f"  ! {warning}")
+                logger.warning("  ! %s", warning)
         else:
-            logger.info(f"✓ {result.name} passed")
+            logger.info("✓ %s passed", result.name)
     
     # Validate compilation if engine path provided
     if engine_path and success:
         logger.info("\nValidating compilation...")
-        success = validate_compilation(plugin_info, engine_path)
+        success = validate_compilation(plugin_info, engine_path, compile_timeout)
     
     return success
 
-def validate_compilation(plugin_info: PluginInfo, engine_path: Path) -> None:
+def validate_compilation(
+    plugin_info: PluginInfo,
+    engine_path: Path,
+    timeout: Optional[float] = None
+) -> None:
     """Validate plugin compilation against latest supported version.
     
     Raises:
         BuildError: If compilation fails
         ConfigurationError: If engine path is invalid
     """
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_dir_path = Path(temp_dir)
-        
-        # Copy plugin to temp directory
+    from unreal_build_tools.core import jsonio
+    from unreal_build_tools.core.exceptions import BuildError
+    from unreal_build_tools.core.filesystem import (
+        fast_copytree, link_tree, remove_directory, temporary_directory
+    )
+    from unreal_build_tools.core.platform_utils import get_platform
+    from unreal_build_tools.core.structs import CompilerConfig
+    from unreal_build_tools.impl.plugin_compiler import PluginCompiler
+
+    # The build tree is large, let packaging start while it is deleted
+    with temporary_directory(background_cleanup=True) as temp_dir_path:
+        # Mirror the plugin through links rather than copying it, BuildPlugin
+        # copies the sources into its own host project and only reads these
         temp_plugin_dir = temp_dir_path / plugin_info.source_dir.name
-        shutil.copytree(plugin_info.source_dir, temp_plugin_dir)
+        try:
+            link_tree(
+                plugin_info.source_dir,
+                temp_plugin_dir,
+                exclude=(plugin_info.uplugin_file.name,)
+            )
+        except OSError as e:
+            logger.debug("Could not link plugin for validation, copying instead: %s", e)
+            remove_directory(temp_plugin_dir)
+            fast_copytree(plugin_info.source_dir, temp_plugin_dir)
         
         # Update .uplugin for latest version
         latest_version = max(DEFAULT_VERSIONS)
         temp_uplugin = temp_plugin_dir / plugin_info.uplugin_file.name
-        with temp_uplugin.open('r') as f:
-            uplugin_data = json.load(f)
-        
-        uplugin_data['EngineVersion'] = f"{latest_version}.0"
-        with temp_uplugin.open('w') as f:
-            json.dump(uplugin_data, f, indent=2)
+        uplugin_data = dict(plugin_info.plugin_data, EngineVersion=f"{latest_version}.0")
+        temp_uplugin.write_bytes(jsonio.dumps(uplugin_data))
         
         # Try compilation
         config = CompilerConfig(
             platform=get_platform(),
             source=temp_uplugin,
             output_dir=temp_dir_path / "build",
-            engine_path=engine_path
+            engine_path=engine_path,
+            timeout=timeout
         )
         compiler = PluginCompiler(config)
         
         if not compiler.run():
             raise BuildError(f"Compilation failed for UE {latest_version}")
             
-        logger.info(f"✓ Compilation validation passed (UE {latest_version})")
+        logger.info("✓ Compilation validation passed (UE %s)", latest_version)
 
 
 def main():
@@ -109,12 +153,27 @@ def main():
     parser.add_argument("-e", "--engine", help="Engine version for validation, defaults to highest version packaged")
     parser.add_argument("--skip-validation", action="store_true",
                        help="Skip validation checks")
+    parser.add_argument("--no-validation-cache", action="store_true",
+                       help="Always rerun validation, even if the plugin files are unchanged")
+    parser.add_argument("--compile-timeout", type=float,
+                       help="Abort the validation build if it runs longer than this many seconds")
+    parser.add_argument("--serial-staging", action="store_true",
+                       help="Copy staged files one at a time, useful when debugging staging")
     parser.add_argument(
         '--verbose',
         action='store_true',
         help='Enable verbose logging'
     )
     args = parser.parse_args()
+
+    import tempfile
+    from unreal_build_tools.core.exceptions import ValidationError, BuildError, ConfigurationError
+    from unreal_build_tools.core.filesystem import find_uplugin, temporary_directory
+    from unreal_build_tools.core.filter_config import compile_filter, parse_filter_config
+    from unreal_build_tools.core.platform_utils import get_engine_path
+    from unreal_build_tools.packaging import package_versions_for_fab
+    from unreal_build_tools.staging import stage_plugin_files
+
     if args.output:
         output_dir = Path(args.output)
     else:
@@ -130,17 +189,24 @@ def main():
         )
         
         output_dir.mkdir(parents=True, exist_ok=True)
+        # Compile the FilterPlugin.ini patterns once for the whole run
+        matcher = compile_filter(parse_filter_config(initial_plugin_info.source_dir))
         
         # Stage plugin files first
         with temporary_directory() as staging_dir:
             logger.info("\nStaging plugin files...")
-            staged_plugin_dir = stage_plugin_files(initial_plugin_info, staging_dir, args.verbose)
+            staged_plugin_dir = stage_plugin_files(
+                initial_plugin_info, staging_dir, args.verbose, matcher,
+                max_workers=1 if args.serial_staging else None
+            )
             
             # Create new plugin info from staged files
+            # The staged .uplugin is a straight copy, reuse the parsed data
             staged_plugin_info = PluginInfo(
                 uplugin_file=next(staged_plugin_dir.glob("*.uplugin")),
                 source_dir=staged_plugin_dir,
-                versions=versions
+                versions=versions,
+                plugin_data=initial_plugin_info.plugin_data
             )
             
             # Rest of processing uses staged_plugin_info
@@ -148,23 +214,26 @@ def main():
                 logger.info("\nValidating plugin...")
                 engine_path = get_engine_path(args.engine or versions[-1])
                 try:
-                    validate_plugin(staged_plugin_info, engine_path)
+                    validate_plugin(
+                        staged_plugin_info,
+                        engine_path,
+                        args.compile_timeout,
+                        use_cache=not args.no_validation_cache
+                    )
                 except (ValidationError, BuildError) as e:
-                    logger.error(f"Validation failed: {e}")
+                    logger.error("Validation failed: %s", e)
                     sys.exit(1)
             
-            for version in versions:
-                logger.info(f"\nPackaging for UE {version}...")
-                try:
-                    package_version_for_fab(staged_plugin_info.source_dir, version, output_dir)
-                except (ConfigurationError, RuntimeError) as e:
-                    logger.error(f"Packaging failed: {e}")
-                    sys.exit(1)
+            try:
+                package_versions_for_fab(staged_plugin_info.source_dir, versions, output_dir)
+            except (ConfigurationError, RuntimeError) as e:
+                logger.error("Packaging failed: %s", e)
+                sys.exit(1)
                     
-        logger.info(f"\nPackaging complete! Files are in: {output_dir}")
+        logger.info("\nPackaging complete! Files are in: %s", output_dir)
         
     except Exception as e:
-        logger.error(f"Error: {e}")
+        logger.error("Error: %s", e)
         sys.exit(1)
 
 if __name__ == "__main__":
@@ -1,7 +1,8 @@
 from __future__ import absolute_import, unicode_literals
-from typing import List
+from typing import FrozenSet, Tuple
 from enum import Enum, auto
 from types import SimpleNamespace
+import os
 
 class Platform(Enum):
     WIN64 = "Win64"
@@ -9,35 +10,46 @@ class Platform(Enum):
     MAC = "Mac"
     UNKNOWN = "Unknown"
 
-SUPPORTED_PLATFORMS: List[Platform] = [
+SUPPORTED_PLATFORMS: FrozenSet[Platform] = frozenset((
     Platform.WIN64,
     Platform.LINUX,
     Platform.MAC,
-]
+))
 
-SUPPORTED_CONFIGURATIONS: List[str] = [
+SUPPORTED_CONFIGURATIONS: Tuple[str, ...] = (
     "Debug",
     "Development",
     "Shipping",
     "Test"
-]
+)
 
-LOG_LEVELS: List[str] = [
+LOG_LEVELS: Tuple[str, ...] = (
     "DEBUG",
     "INFO",
     "WARNING",
     "ERROR",
     "CRITICAL"
-]
+)
 
 ENV = SimpleNamespace(
     ENGINE_BASE_DIR="UBT_ENGINE_BASE_DIR"
 )
 
 
-# File type definitions
-SOURCE_FILE_EXTENSIONS = ['.h', '.hh', '.cpp', '.cc', '.cs', '.py']
-EXECUTABLE_PATTERNS = ['*.sh', '*.cmd', '*.bat', '*.exe']
+# File type definitions, tuples so they can be passed to str.endswith
+SOURCE_FILE_EXTENSIONS = ('.h', '.hh', '.cpp', '.cc', '.cs', '.py')
+EXECUTABLE_PATTERNS = ('*.sh', '*.cmd', '*.bat', '*.exe')
+# Already compressed formats, deflating them again costs CPU for no gain.
+# Lowercase, compare against lowercased names.
+STORED_FILE_EXTENSIONS = (
+    '.png', '.jpg', '.jpeg', '.webp',
+    '.zip', '.7z', '.gz', '.bz2', '.xz',
+    '.mp3', '.ogg', '.opus', '.mp4', '.webm', '.bk2',
+)
+
+# Worker count for thread pools that read or copy files. The work is I/O
+# bound, so it is not limited to the number of cores.
+IO_WORKERS = min(32, (os.cpu_count() or 1) * 4)
 
 # Validation settings
 MAX_PATH_LENGTH = 170
@@ -46,4 +58,4 @@ THIRD_PARTY_MARKER = 'ThirdParty'
 # FabURL validation
 FAB_URL_PATTERN = r'[0-9a-f]{8}(?:-[0-9a-f]{4}){3}-[0-9a-f]{12}'
 
-COMMENT_PREFIXES = ['//', '/*', '"""', "'''", '#']
\ No newline at end of file
+COMMENT_PREFIXES = ('//', '/*', '"""', "'''", '#')
\ No newline at end of file
@@ -3,16 +3,71 @@
 This module provides utilities for finding and managing plugin files
 and build directories related to Unreal Engine plugins.
 """
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
-from typing import Union, Iterator
+from typing import Union, Iterable, Iterator, Callable, Any, List, Tuple
+import errno
 import tempfile
 import shutil
+import subprocess
+import stat
 import sys
+import os
+import threading
+import uuid
 from pathlib import Path
 from .logging import setup_logger
 
+if os.name == "nt":
+    import _winapi
+elif sys.platform == "darwin":
+    import ctypes
+
 logger = setup_logger(__name__)
 
+# Native tree removal is much faster than walking large build trees from Python,
+# probe for it once rather than on every delete.
+if os.name == "nt":
+    _NATIVE_RM = shutil.which("cmd")
+    _NATIVE_COPY = shutil.which("robocopy")
+else:
+    _NATIVE_RM = shutil.which("rm")
+    _NATIVE_COPY = shutil.which("cp")
+
+# robocopy exit codes below 8 all mean the copy succeeded
+_ROBOCOPY_FAILED = 8
+_ROBOCOPY_THREADS = 16
+# rd is a cmd.exe builtin, so its path goes through cmd's parser. Paths with
+# any of these are removed from Python instead of being run through cmd.
+_CMD_METACHARS = frozenset('&|<>^%!"()')
+
+# copy_file_range lets the kernel copy, or reflink on Btrfs/XFS, without
+# the data passing through user space. Like CPython's own fast copy paths,
+# it is only trusted once it has copied something, anything else falls back
+# to the regular copy.
+_HAS_COPY_FILE_RANGE = hasattr(os, "copy_file_range")
+_COPY_FILE_RANGE_CHUNK = 1 << 30
+
+# clonefile(2) makes an APFS copy-on-write clone, sharing the data blocks
+# instead of copying them. It will not replace an existing file, and these
+# errors fall back to the regular copy.
+_clonefile = None
+if sys.platform == "darwin":
+    try:
+        _clonefile = ctypes.CDLL(None, use_errno=True).clonefile
+        _clonefile.argtypes = (ctypes.c_char_p, ctypes.c_char_p, ctypes.c_uint32)
+        _clonefile.restype = ctypes.c_int
+    except (OSError, AttributeError):
+        _clonefile = None
+_CLONEFILE_UNSUPPORTED = {
+    errno.ENOTSUP, errno.EOPNOTSUPP, errno.EXDEV, errno.EEXIST, errno.EINVAL
+}
+
+# Worker count for the Python fallback delete, unlinks are syscall bound
+_REMOVE_WORKERS = min(16, (os.cpu_count() or 4) * 2)
+_UNLINK_BATCH_SIZE = 256
+_UNLINK_DIR_FD = os.unlink in os.supports_dir_fd
+
 def find_uplugin(path: Union[str, None, Path] = None) -> Path:
     """Find and validate plugin path.
     
@@ -29,21 +84,36 @@ def find_uplugin(path: Union[str, None, Path] = None) -> Path:
     """
     if path is None:
         path = Path.cwd()
-    plugin_path = Path(path)
-    if plugin_path.is_file():
+    try:
+        # One stat answers both whether the path exists and what it is
+        mode = os.stat(path).st_mode
+    except OSError:
+        logger.error(f"Invalid path: {path}")
+        raise RuntimeError(f"Invalid path: {path}")
+    plugin_path = Path(path).resolve()
+    if stat.S_ISREG(mode):
         if plugin_path.suffix != ".uplugin":
             logger.error(f"Invalid file type: {plugin_path}")
             raise RuntimeError(f"Invalid file type: {plugin_path}")
         logger.debug(f"Using specified plugin file: {plugin_path}")
-        return plugin_path.resolve()
-    elif plugin_path.is_dir():
+        return plugin_path
+    elif stat.S_ISDIR(mode):
         directory = plugin_path
         logger.debug(f"Searching for plugins in directory: {directory}")
     else:
         logger.error(f"Invalid path: {plugin_path}")
         raise RuntimeError(f"Invalid path: {plugin_path}")
 
-    plugins = list(directory.glob("*.uplugin"))
+    # Only two matches are needed to tell none, one or many apart. Like the
+    # glob this replaces, the suffix is matched case-insensitively on Windows.
+    plugins = []
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            name = entry.name.lower() if os.name == "nt" else entry.name
+            if name.endswith(".uplugin") and entry.is_file():
+                plugins.append(entry.path)
+                if len(plugins) > 1:
+                    break
     if not plugins:
         logger.error("No .uplugin file found in current directory")
         raise RuntimeError("No .uplugin file found in current directory")
@@ -51,15 +121,426 @@ def find_uplugin(path: Union[str, None, Path] = None) -> Path:
         logger.error("Multiple .uplugin files found. Please specify one.")
         raise RuntimeError("Multiple .uplugin files found. Please specify one.")
     
-    plugin_path = plugins[0]
+    # directory is already resolved, so the match is too
+    plugin_path = Path(plugins[0])
     logger.info(f"Found plugin file: {plugin_path}")
-    return plugin_path.resolve()
+    return plugin_path
+
+
+def iter_files(root: Union[str, Path]) -> Iterator[Tuple[os.DirEntry, str]]:
+    """Recursively yield the files below a directory.
+    
+    Walks with os.scandir, whose entries carry the file type from the
+    directory listing, so no Path objects are built and no extra stat is
+    needed per entry. Symlinked directories are not followed.
+    
+    Args:
+        root (Union[str, Path]): Directory to walk
+    
+    Yields:
+        Tuple[os.DirEntry, str]: File entry and its path relative to root,
+            using the platform separator
+    """
+    stack = [(os.fspath(root), '')]
+    while stack:
+        dir_path, rel_dir = stack.pop()
+        with os.scandir(dir_path) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append((entry.path, rel_dir + entry.name + os.sep))
+                elif entry.is_file():
+                    yield entry, rel_dir + entry.name
+
+
+def _copy_file_range(src: Union[str, os.DirEntry], dst: str) -> bool:
+    """Copy a file's contents with os.copy_file_range.
+    
+    Returns:
+        bool: False if copy_file_range could not be used for this pair of
+            files and the caller should copy another way
+    
+    Raises:
+        OSError: If the copy failed part way through
+    """
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        src_fd = fsrc.fileno()
+        dst_fd = fdst.fileno()
+        size = os.fstat(src_fd).st_size
+        copied = 0
+        while True:
+            try:
+                count = os.copy_file_range(src_fd, dst_fd, _COPY_FILE_RANGE_CHUNK)
+            except OSError as e:
+                if copied:
+                    raise
+                # Unsupported, cross device or refused by a sandbox
+                logger.debug(f"copy_file_range unavailable for {dst}: {e}")
+                return False
+            if not count:
+                break
+            copied += count
+    # Some file systems report 0 before the end (procfs, some FUSE and CIFS
+    # setups), never hand on a short copy
+    if copied != size:
+        logger.debug(f"copy_file_range copied {copied} of {size} bytes to {dst}")
+        return False
+    return True
+
+
+def _clone_file(src: Union[str, os.DirEntry], dst: str) -> None:
+    """Clone a file with clonefile(2), raising OSError on failure."""
+    if _clonefile(os.fsencode(src), os.fsencode(dst), 0) != 0:
+        err = ctypes.get_errno()
+        raise OSError(err, os.strerror(err), dst)
+
+
+def copy_file(src: Union[str, os.DirEntry], dst: Union[str, Path]) -> None:
+    """Copy a file with its metadata, like shutil.copy2 for a file target.
+    
+    On Linux the contents are copied with os.copy_file_range, which stays
+    in the kernel and can share extents on copy-on-write file systems.
+    On macOS a new file is cloned with clonefile, which shares blocks on
+    APFS. Anywhere else, or when the file system does not support it, this
+    is shutil.copyfile, which uses sendfile/fcopyfile where it can.
+    
+    Args:
+        src (Union[str, os.DirEntry]): File to copy. Passing a DirEntry lets
+            shutil reuse its cached stat
+        dst (Union[str, Path]): Destination file path
+    """
+    dst = os.fspath(dst)
+    if _HAS_COPY_FILE_RANGE:
+        if not _copy_file_range(src, dst):
+            shutil.copyfile(src, dst)
+    elif _clonefile is not None:
+        try:
+            _clone_file(src, dst)
+        except OSError as e:
+            if e.errno not in _CLONEFILE_UNSUPPORTED:
+                raise
+            shutil.copyfile(src, dst)
+    else:
+        shutil.copyfile(src, dst)
+    shutil.copystat(src, dst)
+
+
+def atomic_write_bytes(path: Union[str, Path], data: bytes) -> None:
+    """Replace a file's contents in one step.
+    
+    The data is written to a sibling temporary file which is then renamed
+    over the target, so readers never see a partially written file.
+    
+    Args:
+        path (Union[str, Path]): File to write
+        data (bytes): New contents
+    """
+    path = os.fspath(path)
+    fd, temp_path = tempfile.mkstemp(
+        prefix=os.path.basename(path) + ".", dir=os.path.dirname(path) or None
+    )
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        # mkstemp creates the file private, keep the target's permissions
+        try:
+            os.chmod(temp_path, stat.S_IMODE(os.stat(path).st_mode))
+        except FileNotFoundError:
+            pass
+        os.replace(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+
+def _on_rm_error(func: Callable[..., Any], path: str) -> None:
+    """Clear the read-only flag on a path that failed to delete and retry.
+
+    Unreal build artifacts are frequently marked read-only on Windows, which
+    makes the default rmtree implementation fail on them.
+    """
+    os.chmod(path, stat.S_IWRITE)
+    func(path)
+
+
+def _retry_writable(func: Callable[[str], Any], path: str) -> None:
+    """Run a removal function, retrying once with the read-only flag cleared."""
+    try:
+        func(path)
+    except PermissionError:
+        _on_rm_error(func, path)
+
+
+def _unlink_batch(dir_path: str, names: List[str]) -> None:
+    """Unlink a batch of entries that all live in the same directory.
+    
+    Where supported the names are unlinked relative to an open handle on
+    the directory (unlinkat), so the kernel does not walk the full path
+    again for every file.
+    """
+    if not _UNLINK_DIR_FD:
+        for name in names:
+            _retry_writable(os.unlink, os.path.join(dir_path, name))
+        return
+    dir_fd = os.open(dir_path, os.O_RDONLY | getattr(os, "O_DIRECTORY", 0))
+    try:
+        for name in names:
+            os.unlink(name, dir_fd=dir_fd)
+    finally:
+        os.close(dir_fd)
+
+
+def _is_junction(entry: os.DirEntry) -> bool:
+    """Check if a directory entry is a Windows junction or other reparse point.
+    
+    Junctions report as directories rather than symlinks, so they must be
+    checked for explicitly to avoid deleting the contents they point to.
+    """
+    if os.name != "nt":
+        return False
+    attributes = entry.stat(follow_symlinks=False).st_file_attributes
+    return bool(attributes & stat.FILE_ATTRIBUTE_REPARSE_POINT)
+
+
+def _walk_remove_directory(path: str) -> None:
+    """Remove a directory tree from Python.
+    
+    The tree is listed with os.scandir, whose entries carry the file type
+    from the directory listing, so classifying an entry costs no extra
+    stat. Unlinks are pure syscalls that release the GIL, so they are
+    grouped per directory and spread over a thread pool; directories are
+    then removed serially, deepest first.
+    """
+    batches = []
+    dirs_to_remove = []
+    junctions = []
+    stack = [path]
+    while stack:
+        dir_path = stack.pop()
+        dirs_to_remove.append(dir_path)
+        names = []
+        with os.scandir(dir_path) as entries:
+            for entry in entries:
+                # Symlinked directories are unlinked, never walked into
+                if entry.is_dir(follow_symlinks=False):
+                    if _is_junction(entry):
+                        junctions.append(entry.path)
+                    else:
+                        stack.append(entry.path)
+                else:
+                    names.append(entry.name)
+        for start in range(0, len(names), _UNLINK_BATCH_SIZE):
+            batches.append((dir_path, names[start:start + _UNLINK_BATCH_SIZE]))
+
+    with ThreadPoolExecutor(max_workers=_REMOVE_WORKERS) as executor:
+        futures = [executor.submit(_unlink_batch, *batch) for batch in batches]
+        # Collect the results so any failure is raised here
+        for future in futures:
+            future.result()
+    # Removing a junction only removes the link, not the linked contents
+    for junction in junctions:
+        os.rmdir(junction)
+    # Parents are always listed before their children
+    for dir_path in reversed(dirs_to_remove):
+        _retry_writable(os.rmdir, dir_path)
+
+
+def _native_remove_directory(path: str) -> bool:
+    """Remove a directory tree with the platform's native tool.
+    
+    Returns:
+        bool: True if the directory no longer exists afterwards
+    """
+    if not _NATIVE_RM:
+        return False
+    if os.name == "nt":
+        if not _CMD_METACHARS.isdisjoint(path):
+            return False
+        cmd = [_NATIVE_RM, "/c", "rd", "/s", "/q", path]
+    else:
+        cmd = [_NATIVE_RM, "-rf", path]
+    try:
+        subprocess.run(
+            cmd,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            check=False
+        )
+    except OSError as e:
+        logger.debug(f"Native removal of {path} failed: {e}")
+        return False
+    # rd does not report failures through its exit code, so check the result
+    return not os.path.lexists(path)
+
+
+def _remove_directory_in_background(path: str) -> None:
+    """Thread target for remove_directory(background=True)."""
+    try:
+        remove_directory(path)
+    except Exception as e:
+        logger.warning(f"Failed to cleanup directory {path}: {e}")
+
+
+def remove_directory(path: Union[str, Path], background: bool = False) -> None:
+    """Recursively delete a directory tree.
+    
+    Uses the native rm/rd command where available and falls back to
+    a bottom-up walk for anything it could not remove.
+    
+    Args:
+        path (Union[str, Path]): Directory to delete
+        background (bool, optional): Rename the directory out of the way and
+            delete it on a worker thread so the caller can carry on.
+            Defaults to False. Always synchronous on Windows.
+        
+    Raises:
+        OSError: If the directory could not be removed
+    """
+    path = os.fspath(path)
+    if background and os.name != "nt":
+        parent, name = os.path.split(path.rstrip(os.sep))
+        trash_path = os.path.join(parent, f".{name}.trash-{uuid.uuid4().hex}")
+        try:
+            os.rename(path, trash_path)
+        except OSError as e:
+            logger.debug(f"Could not move {path} aside for deletion: {e}")
+        else:
+            # Not a daemon, the interpreter waits for the delete on exit
+            threading.Thread(
+                target=_remove_directory_in_background,
+                args=(trash_path,),
+                name="ubt-remove-directory",
+            ).start()
+            return
+    if _native_remove_directory(path):
+        return
+    _walk_remove_directory(path)
+
+
+
+def _native_copytree(src: str, dst: str) -> bool:
+    """Copy a directory tree with the platform's native tool.
+    
+    cp implementations without clone support (busybox, older macOS) reject
+    the flag and fail, leaving the copy to the Python fallback.
+    
+    Returns:
+        bool: True if the copy succeeded
+    """
+    if not _NATIVE_COPY:
+        return False
+    if os.name == "nt":
+        # No trailing separators, a quoted "C:\dir\" escapes its closing quote
+        cmd = [
+            _NATIVE_COPY, src, dst, "/E", f"/MT:{_ROBOCOPY_THREADS}",
+            "/NFL", "/NDL", "/NJH", "/NJS", "/NP",
+        ]
+    elif sys.platform == "darwin":
+        # -c clones files with clonefile(2), copy-on-write on APFS
+        cmd = [_NATIVE_COPY, "-c", "-a", src, dst]
+    else:
+        # Shares extents instead of copying data on Btrfs/XFS, a plain copy elsewhere
+        cmd = [_NATIVE_COPY, "-a", "--reflink=auto", src, dst]
+    try:
+        result = subprocess.run(
+            cmd,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            check=False
+        )
+    except OSError as e:
+        logger.debug(f"Native copy of {src} failed: {e}")
+        return False
+    if os.name == "nt":
+        return result.returncode < _ROBOCOPY_FAILED
+    return result.returncode == 0
+
+
+def fast_copytree(src: Union[str, Path], dst: Union[str, Path]) -> None:
+    """Copy a directory tree to a new location.
+    
+    Uses robocopy (multi-threaded) on Windows and cp -a elsewhere, which
+    are much faster than shutil.copytree on large trees, and falls back to
+    shutil.copytree if the native tool is missing or fails. On copy-on-write
+    file systems (APFS, Btrfs, XFS) cp clones files instead of copying
+    their data, as does the fallback through copy_file.
+    
+    Args:
+        src (Union[str, Path]): Directory to copy
+        dst (Union[str, Path]): Destination, must not exist yet
+        
+    Raises:
+        OSError: If the tree could not be copied
+    """
+    src = os.fspath(src)
+    dst = os.fspath(dst)
+    # Match shutil.copytree, cp would otherwise copy into an existing dst
+    if os.path.lexists(dst):
+        raise FileExistsError(f"Destination already exists: {dst}")
+    os.makedirs(os.path.dirname(os.path.abspath(dst)), exist_ok=True)
+    if _native_copytree(src, dst):
+        return
+    logger.debug(f"Falling back to shutil.copytree for {src}")
+    if os.path.lexists(dst):
+        remove_directory(dst)
+    shutil.copytree(src, dst, copy_function=copy_file)
+
+
+def _link_directory(src: str, dst: str) -> None:
+    """Link dst to the directory src.
+    
+    Windows uses a junction, which unlike a symlink needs no privileges.
+    """
+    if os.name == "nt":
+        _winapi.CreateJunction(src, dst)
+    else:
+        os.symlink(src, dst, target_is_directory=True)
+
+
+def link_tree(
+    src: Union[str, Path],
+    dst: Union[str, Path],
+    exclude: Iterable[str] = ()
+) -> None:
+    """Build a lightweight view of a directory without copying its contents.
+    
+    Each top level subdirectory of src is linked into dst (a junction on
+    Windows, a symlink elsewhere) and top level files are copied, so the
+    cost is independent of the size of the tree. Files reached through
+    the links are shared with src and must not be modified.
+    
+    Args:
+        src (Union[str, Path]): Directory to mirror
+        dst (Union[str, Path]): Directory to create, must not exist yet
+        exclude (Iterable[str], optional): Top level names to leave out,
+            for files the caller wants to write itself. Defaults to ().
+    
+    Raises:
+        OSError: If a link could not be created, e.g. on file systems
+            without link support
+    """
+    src = os.path.abspath(src)
+    dst = os.fspath(dst)
+    exclude = set(exclude)
+    os.makedirs(dst)
+    with os.scandir(src) as entries:
+        for entry in entries:
+            if entry.name in exclude:
+                continue
+            target = os.path.join(dst, entry.name)
+            if entry.is_dir():
+                _link_directory(entry.path, target)
+            else:
+                copy_file(entry, target)
 
 
 @contextmanager
-def temporary_directory() -> Iterator[Path]:
+def temporary_directory(background_cleanup: bool = False) -> Iterator[Path]:
     """Create and manage a temporary directory that auto-cleans.
     
+    Args:
+        background_cleanup (bool, optional): Delete the directory on a worker
+            thread after exiting the context. Defaults to False.
+    
     Yields:
         Path: Path to temporary directory
         
@@ -71,7 +552,7 @@ def temporary_directory() -> Iterator[Path]:
         yield Path(temp_dir)
     finally:
         try:
-            shutil.rmtree(temp_dir)
+            remove_directory(temp_dir, background=background_cleanup)
         except Exception as e:
             print(f"Warning: Failed to cleanup temporary directory {temp_dir}: {e}", 
                   file=sys.stderr)
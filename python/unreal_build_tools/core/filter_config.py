@@ -7,17 +7,162 @@ recursive directory inclusion and pattern matching.
 """
 
 from pathlib import Path
-from typing import List
-import configparser
+from typing import Iterable, List, Optional, Pattern, Set, Tuple
 import fnmatch
+import functools
+import re
 import shutil
 import logging
 
 logger = logging.getLogger(__name__)
 
+_WILDCARD_CHARS = ('*', '?', '[')
+
+def _translate_segment(segment: str) -> str:
+    """Translate a single glob path segment into a regex fragment."""
+    result = []
+    i = 0
+    while i < len(segment):
+        char = segment[i]
+        i += 1
+        if char == '*':
+            result.append('[^/]*')
+        elif char == '?':
+            result.append('[^/]')
+        elif char == '[':
+            end = segment.find(']', i + 1)
+            if end == -1:
+                result.append(re.escape(char))
+                continue
+            body = segment[i:end]
+            if body.startswith('!'):
+                body = '^' + body[1:]
+            result.append('[' + body.replace('\\', '\\\\') + ']')
+            i = end + 1
+        else:
+            result.append(re.escape(char))
+    return ''.join(result)
+
+def _translate_pattern(pattern: str) -> str:
+    """Translate a glob pattern into a regex matching relative file paths.
+
+    Follows pathlib glob semantics: '*' and '?' never cross a '/', and a
+    '**' segment matches zero or more directories.
+    """
+    parts = []
+    for segment in pattern.split('/'):
+        if segment == '**':
+            parts.append('(?:[^/]+/)*')
+        else:
+            parts.append(_translate_segment(segment) + '/')
+    return ''.join(parts)[:-1] if not pattern.endswith('**') else ''.join(parts)
+
+def _static_prefix(pattern: str) -> str:
+    """Directory portion of a pattern before its first wildcard segment."""
+    static = []
+    for segment in pattern.split('/')[:-1]:
+        if any(char in segment for char in _WILDCARD_CHARS):
+            break
+        static.append(segment)
+    return '/'.join(static)
+
+def _normalize_pattern(pattern: str) -> str:
+    """Normalize a FilterPlugin pattern for matching against relative paths."""
+    return pattern.replace('\\', '/').lstrip('/').lower()
+
+class FilterMatcher:
+    """Compiled form of a list of FilterPlugin include patterns.
+
+    Built once per run and shared by every pass that needs to test paths
+    against the filter. All paths passed in must be lowercase, '/'
+    separated and relative to the plugin root; matching is
+    case-insensitive, like Unreal's own handling of FilterPlugin.ini.
+    """
+    __slots__ = ('patterns', 'literals', 'regex', 'dir_prefixes', 'match_roots')
+
+    def __init__(self, patterns: Iterable[str]):
+        """Compile the patterns.
+
+        Patterns without wildcards are plain relative file paths and are
+        kept in a set; all others are joined into one alternation so each
+        path is tested with a single regex match rather than once per
+        pattern.
+
+        Args:
+            patterns (Iterable[str]): Include patterns relative to the plugin root
+        """
+        # Immutable, compile_filter shares matchers between callers
+        self.patterns = tuple(patterns)
+        self.literals: Set[str] = set()
+        # Directories that lead towards a pattern's fixed directory
+        self.dir_prefixes: Set[str] = set()
+        # Directories below which a pattern may match anything
+        self.match_roots: Set[str] = set()
+        regexes = []
+        for pattern in self.patterns:
+            pattern = _normalize_pattern(pattern)
+            if not pattern:
+                continue
+            if any(char in pattern for char in _WILDCARD_CHARS):
+                regexes.append('(?:' + _translate_pattern(pattern) + ')')
+            else:
+                self.literals.add(pattern)
+            prefix = _static_prefix(pattern)
+            parent, _, name = pattern.rpartition('/')
+            if prefix == parent and name != '**':
+                # Only matches files directly inside parent, so just the
+                # directories leading there need walking
+                parts = parent.split('/') if parent else []
+                for depth in range(1, len(parts) + 1):
+                    self.dir_prefixes.add('/'.join(parts[:depth]))
+            else:
+                # '**' or a wildcard directory can match at any depth below
+                # the fixed prefix
+                self.match_roots.add(prefix)
+                parts = prefix.split('/') if prefix else []
+                for depth in range(1, len(parts)):
+                    self.dir_prefixes.add('/'.join(parts[:depth]))
+        self.regex: Optional[Pattern[str]] = re.compile('|'.join(regexes)) if regexes else None
+
+    def match_file(self, rel_lower: str) -> bool:
+        """Check whether a relative file path is included."""
+        if rel_lower in self.literals:
+            return True
+        return self.regex is not None and self.regex.fullmatch(rel_lower) is not None
+
+    def can_contain_match(self, rel_dir_lower: str) -> bool:
+        """Check whether any included file could live below a directory."""
+        if rel_dir_lower in self.dir_prefixes or '' in self.match_roots:
+            return True
+        return any(
+            rel_dir_lower == root or rel_dir_lower.startswith(root + '/')
+            for root in self.match_roots
+        )
+
+def compile_filter(patterns: Iterable[str]) -> FilterMatcher:
+    """Get the compiled matcher for a list of patterns.
+    
+    Matchers are cached on the patterns, so repeated calls with the same
+    FilterPlugin.ini contents reuse one compiled regex.
+    
+    Args:
+        patterns (Iterable[str]): Include patterns relative to the plugin root
+    
+    Returns:
+        FilterMatcher: Shared matcher, must not be modified
+    """
+    return _compile_filter(tuple(patterns))
+
+@functools.lru_cache(maxsize=16)
+def _compile_filter(patterns: Tuple[str, ...]) -> FilterMatcher:
+    """Build a FilterMatcher, cached on the pattern tuple."""
+    return FilterMatcher(patterns)
+
 def parse_filter_config(plugin_root: Path) -> List[str]:
     """Parse FilterPlugin.ini to get files to include.
     
+    The parsed patterns are cached for as long as the file is unchanged.
+    
     Args:
         plugin_root (Path): Plugin root directory
         
@@ -28,30 +173,48 @@ def parse_filter_config(plugin_root: Path) -> List[str]:
         RuntimeError: If FilterPlugin.ini is missing or invalid
     """
     filter_path = plugin_root / "Config" / "FilterPlugin.ini"
-    if not filter_path.exists():
+    try:
+        mtime_ns = filter_path.stat().st_mtime_ns
+    except FileNotFoundError:
         raise RuntimeError(
             "FilterPlugin.ini not found in Config directory.\n"
             "This file is required to specify which files should be packaged."
         )
-    
-    config = configparser.ConfigParser(allow_no_value=True)
+    # Callers get their own list, the cached result must not change
+    return list(_parse_filter_file(str(filter_path), mtime_ns))
+
+@functools.lru_cache(maxsize=16)
+def _parse_filter_file(filter_path: str, mtime_ns: int) -> Tuple[str, ...]:
+    """Parse a FilterPlugin.ini, cached on its path and modification time."""
+    # FilterPlugin.ini is a flat list of patterns under a single section,
+    # so it is scanned line by line rather than loaded with configparser
+    patterns = []
+    seen = set()
+    has_section = False
+    in_section = False
     try:
-        with filter_path.open(encoding='utf-8') as f:
-            config.read_file(f)
-    except Exception as e:
+        with open(filter_path, encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line or line.startswith((';', '#')):
+                    continue
+                if line.startswith('['):
+                    in_section = line == '[FilterPlugin]'
+                    has_section = has_section or in_section
+                    continue
+                if not in_section:
+                    continue
+                # In FilterPlugin.ini, the patterns are actually the keys
+                pattern = line.split('=', 1)[0].strip()
+                # Normalize pattern separators and remove leading slash
+                pattern = pattern.replace('\\', '/').lstrip('/')
+                if pattern and pattern not in seen:
+                    seen.add(pattern)
+                    patterns.append(pattern.replace("...", "**/*.*"))
+    except (OSError, UnicodeDecodeError) as e:
         raise RuntimeError(f"Failed to parse FilterPlugin.ini: {e}")
     
-    if not config.has_section('FilterPlugin'):
+    if not has_section:
         raise RuntimeError("FilterPlugin.ini must have a [FilterPlugin] section")
     
-    # Get all non-empty, non-comment lines
-    patterns = []
-    for key in config['FilterPlugin']:
-        # In FilterPlugin.ini, the patterns are actually the keys
-        pattern = key.strip()
-        # Normalize pattern separators and remove leading slash
-        pattern = pattern.replace('\\', '/')
-        if pattern and not pattern.startswith(';'):
-            patterns.append(pattern.replace("...", "**/*.*"))
-    
-    return patterns
+    return tuple(patterns)
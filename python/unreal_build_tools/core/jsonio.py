@@ -0,0 +1,31 @@
+"""JSON helpers for reading and writing .uplugin descriptors.
+
+Uses orjson when it is installed and falls back to the standard library
+json module otherwise. Both produce the same 2-space indented layout.
+"""
+from typing import Any
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def loads(data: bytes) -> Any:
+    """Parse JSON from bytes.
+    
+    Raises:
+        ValueError: If the data is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any) -> bytes:
+    """Serialize an object to UTF-8 JSON indented by 2 spaces."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    # Non-ASCII text is written as-is, the way orjson writes it
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
@@ -1,41 +1,86 @@
 from __future__ import absolute_import, unicode_literals
+import functools
 import os
 import platform
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
+from . import jsonio
 from .exceptions import PlatformError
 from .logging import setup_logger
 from .constants import Platform, ENV
 
 logger = setup_logger(__name__)
 
+# The host system cannot change during a run, look it up once
+_SYSTEM = platform.system().lower()
+_IS_WINDOWS = _SYSTEM == "windows"
+
+# Where the Epic Games Launcher records its data directory on Windows
+_LAUNCHER_REG_KEY = r"SOFTWARE\WOW6432Node\Epic Games\EpicGamesLauncher"
+
+@functools.lru_cache(maxsize=1)
 def get_platform() -> Platform:
     """Get current platform identifier."""
+    if _IS_WINDOWS:
+        return Platform.WIN64
+    elif _SYSTEM == "darwin":
+        return Platform.MAC
+    elif _SYSTEM == "linux":
+        return Platform.LINUX
+    return Platform.UNKNOWN
+
+def _launcher_manifest_path() -> Path:
+    """Locate the launcher's LauncherInstalled.dat on Windows."""
+    try:
+        import winreg
+        with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, _LAUNCHER_REG_KEY) as key:
+            app_data_path = Path(winreg.QueryValueEx(key, "AppDataPath")[0])
+        # AppDataPath is <ProgramData>\Epic\EpicGamesLauncher\Data
+        epic_data = app_data_path.parents[1]
+    except (OSError, IndexError):
+        epic_data = Path(os.getenv("PROGRAMDATA", r"C:\ProgramData")) / "Epic"
+    return epic_data / "UnrealEngineLauncher" / "LauncherInstalled.dat"
+
+@functools.lru_cache(maxsize=1)
+def _launcher_engine_paths() -> Dict[str, Path]:
+    """Engine installs recorded by the Epic Games Launcher, keyed by version.
+    
+    Returns:
+        Dict[str, Path]: Install directory per version, empty off Windows or
+            if the launcher data cannot be read
+    """
+    if not _IS_WINDOWS:
+        return {}
+
+    manifest_path = _launcher_manifest_path()
     try:
-        system = platform.system().lower()
-        if system == "windows":
-            return Platform.WIN64
-        elif system == "darwin":
-            return Platform.MAC
-        elif system == "linux":
-            return Platform.LINUX
-        return Platform.UNKNOWN
-    except Exception as e:
-        logger.exception("Failed to determine platform")
-        raise PlatformError(f"Could not determine platform: {str(e)}")
+        installation_list = jsonio.loads(manifest_path.read_bytes())["InstallationList"]
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        logger.debug(f"Could not read launcher installs from {manifest_path}: {e}")
+        return {}
+
+    engine_paths = {}
+    for install in installation_list:
+        app_name = install.get("AppName", "")
+        location = install.get("InstallLocation")
+        if app_name.startswith("UE_") and location:
+            engine_paths[app_name[3:]] = Path(location)
+    return engine_paths
 
 def is_platform_supported(platform_name: Platform) -> bool:
     """Check if platform is supported."""
     from .constants import SUPPORTED_PLATFORMS
     return platform_name in SUPPORTED_PLATFORMS
 
+@functools.lru_cache(maxsize=1)
 def get_base_path() -> Path:
     """Get platform-specific UE installation path.
     
     Returns:
         Path
     Raises:
-        PlatformError: If Epic Games directory is not found
+        PlatformError: If Epic Games directory is not found, or the platform
+            has no default location and UBT_ENGINE_BASE_DIR is not set
     """
     if os.getenv(ENV.ENGINE_BASE_DIR):
         base_path = Path(os.getenv(ENV.ENGINE_BASE_DIR))
@@ -43,11 +88,22 @@ def get_base_path() -> Path:
     else:
         platform_name = get_platform()
         if platform_name == Platform.WIN64:
-            base_path = Path(r"C:\Program Files\Epic Games")
+            engine_paths = _launcher_engine_paths()
+            if engine_paths:
+                # Engines are installed side by side, use the newest one's parent
+                newest = max(engine_paths, key=_version_key)
+                base_path = engine_paths[newest].parent
+            else:
+                base_path = Path(r"C:\Program Files\Epic Games")
         elif platform_name == Platform.MAC:
             base_path = Path("/Users/Shared/Epic Games")
         elif platform_name == Platform.LINUX:
             base_path = Path.home() / ".local/share/Epic Games"
+        else:
+            raise PlatformError(
+                f"No default Epic Games directory for platform: {platform.system()}\n"
+                "Please set the UBT_ENGINE_BASE_DIR environment variable"
+            )
     
     if not base_path.is_dir():
         raise PlatformError(
@@ -57,6 +113,7 @@ def get_base_path() -> Path:
         )
     return base_path
 
+@functools.lru_cache(maxsize=None)
 def get_engine_path(version: str, base_path:Optional[str] = None) -> Path:
     """
     Get Unreal Engine installation path.
@@ -70,6 +127,13 @@ def get_engine_path(version: str, base_path:Optional[str] = None) -> Path:
     Raises:
         PlatformError: If engine path could not be located
     """
+    if not base_path and not os.getenv(ENV.ENGINE_BASE_DIR):
+        # The launcher knows exactly where each engine went, even when it is
+        # not under the default directory
+        engine_path = _launcher_engine_paths().get(version)
+        if engine_path is not None and engine_path.is_dir():
+            return engine_path
+
     base_path = Path(base_path) if base_path else get_base_path()
     engine_path = base_path / f"UE_{version}"
 
@@ -79,6 +143,7 @@ def get_engine_path(version: str, base_path:Optional[str] = None) -> Path:
 
 
 
+@functools.lru_cache(maxsize=4)
 def get_uat_script(ue_path: Path) -> Path:
     """Get platform-specific UAT script path.
     
@@ -91,8 +156,7 @@ def get_uat_script(ue_path: Path) -> Path:
     Raises:
         PlatformError: If UAT script is not found
     """
-    system = platform.system().lower()
-    if system == "windows":
+    if _IS_WINDOWS:
         uat_path = ue_path / "Engine/Build/BatchFiles/RunUAT.bat"
     else:
         uat_path = ue_path / "Engine/Build/BatchFiles/RunUAT.sh"
@@ -106,19 +170,57 @@ def get_uat_script(ue_path: Path) -> Path:
     return uat_path
 
 
+def _version_key(version: str) -> Tuple:
+    """Sort key that orders versions numerically, so 5.10 sorts after 5.9.
+    
+    Non-numeric components (e.g. custom source builds) sort after numeric ones.
+    """
+    return tuple(
+        (0, int(part), "") if part.isdigit() else (1, 0, part)
+        for part in version.split('.')
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _scan_ue_versions(base_path: Path) -> Tuple[str, ...]:
+    """List the UE_* installs below base_path, cached per base path."""
+    # DirEntry.is_dir() uses the type from the directory listing, so only
+    # symlinked installs need an extra stat
+    with os.scandir(base_path) as entries:
+        versions = [
+            entry.name[3:]  # Strip "UE_" prefix
+            for entry in entries
+            if entry.name.startswith("UE_") and entry.is_dir()
+        ]
+    versions.sort(key=_version_key)
+    return tuple(versions)
+
+
 def get_ue_versions(base_path: Optional[Path]=None) -> List[str]:
     """Find all installed UE versions.
     
+    The scan runs once per base path and process, later calls reuse it.
+    
     Args:
         base_path (Path): Base Epic Games installation path
     
     Returns:
         List[str]: Sorted list of installed UE versions
     """
-    base_path = base_path or get_base_path()
-    versions = []
-    for path in base_path.glob("UE_*"):
-        if path.is_dir():
-            version = path.name[3:]  # Strip "UE_" prefix
-            versions.append(version)
-    return sorted(versions)
\ No newline at end of file
+    base_path = Path(base_path) if base_path else get_base_path()
+    # Callers get their own list, the cached result must not change
+    return list(_scan_ue_versions(base_path))
+
+
+def clear_caches() -> None:
+    """Forget every cached lookup in this module.
+
+    Use after installing an engine or changing UBT_ENGINE_BASE_DIR within
+    the same process.
+    """
+    get_platform.cache_clear()
+    _launcher_engine_paths.cache_clear()
+    get_base_path.cache_clear()
+    get_engine_path.cache_clear()
+    get_uat_script.cache_clear()
+    _scan_ue_versions.cache_clear()
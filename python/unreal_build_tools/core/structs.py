@@ -3,6 +3,8 @@ from typing import Dict, List, Optional, Any
 from dataclasses import dataclass
 from pathlib import Path
 from .constants import Platform
+from . import jsonio
+from .exceptions import ConfigurationError
 
 @dataclass
 class PluginConfig:
@@ -38,6 +40,7 @@ class CompilerConfig:
     source: Path  # Path to source (.uplugin file)
     output_dir: Path  # Output directory for compiled plugin
     extra_arguments: Optional[Dict[str, Any]] = None  # Additional compiler arguments
+    timeout: Optional[float] = None  # Seconds before the build is aborted, None waits forever
 
 @dataclass
 class PluginInfo:
@@ -46,3 +49,15 @@ class PluginInfo:
     uplugin_file: Path  # Path to the .uplugin file
     versions: List[str]  # List of UE versions to validate against
     plugin_data: Optional[Dict[str, Any]] = None  # Loaded .uplugin data
+
+    def __post_init__(self):
+        """Load the .uplugin once so every consumer shares the parsed data.
+
+        Raises:
+            ConfigurationError: If the .uplugin file cannot be read or parsed
+        """
+        if self.plugin_data is None:
+            try:
+                self.plugin_data = jsonio.loads(self.uplugin_file.read_bytes())
+            except (OSError, ValueError) as e:
+                raise ConfigurationError(f"Failed to parse .uplugin file: {e}")
@@ -0,0 +1,85 @@
+"""On-disk cache of validation results for unchanged plugin trees.
+
+Validation results only depend on the plugin's files and the rules in
+core.constants, so a run over a tree with the same file names, sizes and
+modification times can reuse the results of an earlier run. Staging
+copies files with their modification times, so freshly staged copies of
+an unchanged plugin produce the same signature.
+"""
+from dataclasses import asdict
+from pathlib import Path
+from typing import List, Optional, Union
+import hashlib
+import os
+
+from . import constants, jsonio
+from .filesystem import atomic_write_bytes, iter_files
+from .logging import setup_logger
+from .structs import ValidationResult
+
+logger = setup_logger(__name__)
+
+# Bump when the cached format or the meaning of a result changes
+_CACHE_FORMAT = 1
+
+def get_cache_dir() -> Path:
+    """Get the directory validation results are cached in."""
+    cache_home = os.getenv("XDG_CACHE_HOME") or os.path.join(Path.home(), ".cache")
+    return Path(cache_home) / "ubt" / "validation"
+
+def tree_signature(source_dir: Union[str, Path]) -> str:
+    """Hash a plugin tree's file names, sizes and modification times.
+    
+    Args:
+        source_dir (Union[str, Path]): Plugin root directory
+    
+    Returns:
+        str: Hex digest identifying the tree and the validation rules
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    rules = (
+        _CACHE_FORMAT,
+        Path(source_dir).name,
+        constants.MAX_PATH_LENGTH,
+        constants.SOURCE_FILE_EXTENSIONS,
+        constants.EXECUTABLE_PATTERNS,
+        constants.COMMENT_PREFIXES,
+        constants.THIRD_PARTY_MARKER,
+        constants.FAB_URL_PATTERN,
+    )
+    digest.update(repr(rules).encode())
+    # Sorted, scandir order differs between file systems
+    for entry, rel_path in sorted(iter_files(source_dir), key=lambda item: item[1]):
+        stat_result = entry.stat()
+        digest.update(
+            f"{rel_path}\0{stat_result.st_size}\0{stat_result.st_mtime_ns}\n".encode()
+        )
+    return digest.hexdigest()
+
+def load_results(signature: str) -> Optional[List[ValidationResult]]:
+    """Get the cached results for a tree signature.
+    
+    Returns:
+        Optional[List[ValidationResult]]: Cached results, or None on a miss
+    """
+    path = get_cache_dir() / f"{signature}.json"
+    try:
+        data = jsonio.loads(path.read_bytes())
+        return [ValidationResult(**result) for result in data]
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, TypeError) as e:
+        logger.debug(f"Ignoring unreadable validation cache {path}: {e}")
+        return None
+
+def store_results(signature: str, results: List[ValidationResult]) -> None:
+    """Cache the results for a tree signature, failures are only logged."""
+    cache_dir = get_cache_dir()
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        atomic_write_bytes(
+            cache_dir / f"{signature}.json",
+            jsonio.dumps([asdict(result) for result in results])
+        )
+    except OSError as e:
+        logger.debug(f"Could not write validation cache: {e}")
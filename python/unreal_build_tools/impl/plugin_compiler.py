@@ -2,6 +2,10 @@ from pathlib import Path
 from typing import Optional, Dict, Any
 import subprocess
 import logging
+import os
+import signal
+import sys
+import threading
 
 from unreal_build_tools.interfaces.compiler import ICompiler
 from unreal_build_tools.core.structs import CompilerConfig
@@ -9,6 +13,37 @@ from unreal_build_tools.core.platform_utils import get_uat_script
 
 logger = logging.getLogger(__file__)
 
+# UAT runs in its own process group so the whole build tree (AutomationTool,
+# UBT, the compilers) can be stopped together, not just the RunUAT script
+if sys.platform == "win32":
+    _CREATION_FLAGS = subprocess.CREATE_NO_WINDOW | subprocess.CREATE_NEW_PROCESS_GROUP
+else:
+    _CREATION_FLAGS = 0
+
+def _kill_process_tree(process: subprocess.Popen) -> None:
+    """Kill a process started by PluginCompiler along with its children, then wait.
+
+    Args:
+        process (subprocess.Popen): Process group leader to kill
+    """
+    try:
+        if sys.platform == "win32":
+            subprocess.run(
+                ["taskkill", "/T", "/F", "/PID", str(process.pid)],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                creationflags=subprocess.CREATE_NO_WINDOW,
+                check=False,
+            )
+        else:
+            os.killpg(process.pid, signal.SIGKILL)
+    except OSError as e:
+        logger.debug(f"Could not kill process tree {process.pid}: {e}")
+    # Covers the leader if taskkill failed or the group was already gone
+    if process.poll() is None:
+        process.kill()
+    process.wait()
+
 class PluginCompiler(ICompiler):
     def __init__(self, config: CompilerConfig):
         self._config = config
@@ -22,8 +57,9 @@ class PluginCompiler(ICompiler):
     def setup(self) -> bool:
         """Initialize UAT script path and verify existence."""
         try:
+            # get_uat_script raises if the script is missing
             self._uat_script = get_uat_script(self.compiler_config.engine_path)
-            return self._uat_script.exists()
+            return True
         except Exception as e:
             logger.error(f"Setup failed: {str(e)}")
             return False
@@ -38,24 +74,74 @@ class PluginCompiler(ICompiler):
     def compile(self) -> bool:
         """Compile the plugin using UAT BuildPlugin command."""
         try:
+            # Convert each path to a string once up front
+            uat_script = os.fspath(self._uat_script)
+            plugin = os.fspath(self.compiler_config.source)
+            package = os.fspath(self.compiler_config.output_dir)
             cmd = [
-                str(self._uat_script),
+                uat_script,
                 "BuildPlugin",
-                f"-Plugin={self.compiler_config.source}",
-                f"-Package={self.compiler_config.output_dir}",
+                "-Plugin=" + plugin,
+                "-Package=" + package,
             ]
             
             if self.compiler_config.extra_arguments:
                 for key, value in self.compiler_config.extra_arguments.items():
-                    cmd.append(f"-{key}={value}")
+                    cmd.append("-" + key + "=" + str(value))
             
-            result = subprocess.call(cmd)
-            return result == 0
+            # UAT needs the full parent environment (dotnet, SDK paths, SystemRoot),
+            # and close_fds already uses the fast close_range path on POSIX.
+            # UAT never prompts, so it gets no stdin, and on Windows it runs
+            # without attaching a console window of its own, in a new process
+            # group so a timeout can stop everything it started
+            process = subprocess.Popen(
+                cmd,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                text=True,
+                errors="replace",
+                bufsize=1,
+                creationflags=_CREATION_FLAGS,
+                start_new_session=sys.platform != "win32",
+            )
+            # Forward output line by line from a thread, so CI logs stay in
+            # order and a silent, hung build still hits the timeout below
+            reader = threading.Thread(
+                target=self._forward_output,
+                args=(process.stdout,),
+                daemon=True,
+            )
+            reader.start()
+            try:
+                returncode = process.wait(timeout=self.compiler_config.timeout)
+            except subprocess.TimeoutExpired:
+                _kill_process_tree(process)
+                # Not joined, a build server outside the group may still hold the pipe
+                logger.error(
+                    f"Compilation timed out after {self.compiler_config.timeout} seconds"
+                )
+                return False
+            except BaseException:
+                # UAT is in its own group, so Ctrl+C does not reach it, stop it here
+                _kill_process_tree(process)
+                raise
+            # Long lived build servers can inherit the pipe, don't wait on them
+            reader.join(timeout=5)
+            return returncode == 0
             
         except Exception as e:
             logger.error(f"Compilation error: {str(e)}")
             return False
 
+    @staticmethod
+    def _forward_output(stream) -> None:
+        """Copy the build output to stdout as it arrives."""
+        with stream:
+            for line in stream:
+                sys.stdout.write(line)
+                sys.stdout.flush()
+
     def post_validate(self) -> bool:
         """Verify compilation outputs exist."""
         try:
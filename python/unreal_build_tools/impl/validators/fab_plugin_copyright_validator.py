@@ -1,49 +1,56 @@
+import os
+import re
 from pathlib import Path
-from typing import List
-from unreal_build_tools.interfaces.validator import IValidator
-from unreal_build_tools.core.structs import ValidationResult, PluginInfo
+from typing import Optional
+from unreal_build_tools.interfaces.validator import IFileValidator
 from unreal_build_tools.core.constants import SOURCE_FILE_EXTENSIONS, THIRD_PARTY_MARKER, COMMENT_PREFIXES
 
-class FabPluginCopyrightValidator(IValidator):
+# Each prefix is optional and tried in order, matching the original
+# one-pass strip over COMMENT_PREFIXES in a single regex call. Works on
+# bytes so the header never needs decoding.
+_COMMENT_PREFIX_RE = re.compile(
+    b''.join(b'(?:' + re.escape(prefix.encode()) + b'\\s*)?' for prefix in COMMENT_PREFIXES)
+)
+# Enough to hold any reasonable copyright line
+_HEADER_READ_SIZE = 512
+_UTF8_BOM = b'\xef\xbb\xbf'
+
+class FabPluginCopyrightValidator(IFileValidator):
     """Validates copyright notices in source files."""
+    name = "Copyright Notice Validation"
+    reads_files = True
 
-    def strip_comment_markers(self, line: str) -> str:
+    def strip_comment_markers(self, line: bytes) -> bytes:
         """Strip common comment markers and whitespace from a line."""
         line = line.strip()
-        for prefix in COMMENT_PREFIXES:
-            if line.startswith(prefix):
-                line = line[len(prefix):].strip()
-        return line
+        return line[_COMMENT_PREFIX_RE.match(line).end():]
+
+    def read_first_line(self, path: str) -> bytes:
+        """Read the raw first line of a file without setting up a text stream."""
+        fd = os.open(path, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+        try:
+            head = os.read(fd, _HEADER_READ_SIZE)
+        finally:
+            os.close(fd)
+        first_line = head.split(b'\n', 1)[0]
+        if first_line.startswith(_UTF8_BOM):
+            first_line = first_line[len(_UTF8_BOM):]
+        return first_line
+
+    def applies_to(self, entry: os.DirEntry, rel_path: str) -> bool:
+        """Only source files outside third party code need a notice."""
+        return entry.name.endswith(SOURCE_FILE_EXTENSIONS) and THIRD_PARTY_MARKER not in rel_path
+
+    def check_file(self, entry: os.DirEntry, rel_path: str) -> Optional[str]:
+        """Check a single source file.
 
-    def validate(self) -> ValidationResult:
-        """Check if source files have copyright notices.
-        
         Returns:
-            ValidationResult: Contains validation status and any errors
+            Optional[str]: Error message, or None if the notice is present
         """
-        errors: List[str] = []
-        source_dir = self.plugin_info.source_dir
-        
-        for filepath in source_dir.rglob('*'):
-            if not filepath.is_file():
-                continue
-                
-            rel_path = str(filepath.relative_to(source_dir))
-            
-            # Check copyright for source files
-            if any(filepath.name.endswith(ext) for ext in SOURCE_FILE_EXTENSIONS):
-                if THIRD_PARTY_MARKER not in rel_path:
-                    try:
-                        with filepath.open('r', encoding='utf-8') as f:
-                            first_line = self.strip_comment_markers(f.readline())
-                            if not first_line.lower().startswith('copyright'):
-                                errors.append(f"Missing copyright notice on first line in: {rel_path}")
-                    except Exception as e:
-                        errors.append(f"Failed to check copyright in {rel_path}: {str(e)}")
-
-        return ValidationResult(
-            name="Copyright Notice Validation",
-            success=len(errors) == 0,
-            errors=errors,
-            warnings=[]
-        )
+        try:
+            first_line = self.strip_comment_markers(self.read_first_line(entry.path))
+            if not first_line.lower().startswith(b'copyright'):
+                return f"Missing copyright notice on first line in: {rel_path}"
+        except Exception as e:
+            return f"Failed to check copyright in {rel_path}: {str(e)}"
+        return None
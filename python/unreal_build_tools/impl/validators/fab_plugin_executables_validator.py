@@ -1,33 +1,23 @@
 import fnmatch
-from typing import List
-from unreal_build_tools.interfaces.validator import IValidator
-from unreal_build_tools.core.structs import ValidationResult, PluginInfo
+import os
+import re
+from typing import Optional
+from unreal_build_tools.interfaces.validator import IFileValidator
 from unreal_build_tools.core.constants import EXECUTABLE_PATTERNS
 
-class FabPluginNoExecutablesValidator(IValidator):
-    """Validates executable files in plugin."""
+# All patterns in one regex, so each file name is matched once. Case is
+# ignored on every platform, Windows treats FOO.EXE as executable too.
+_EXECUTABLE_RE = re.compile(
+    '|'.join(fnmatch.translate(pattern) for pattern in EXECUTABLE_PATTERNS),
+    re.IGNORECASE
+)
 
-    def validate(self) -> ValidationResult:
-        """Check for executable files in plugin directory.
-        
-        Returns:
-            ValidationResult: Contains validation status and any errors
-        """
-        errors: List[str] = []
-        source_dir = self.plugin_info.source_dir
-        
-        for filepath in source_dir.rglob('*'):
-            if not filepath.is_file():
-                continue
-                
-            rel_path = str(filepath.relative_to(source_dir))
-            
-            if any(fnmatch.fnmatch(filepath.name, pat) for pat in EXECUTABLE_PATTERNS):
-                errors.append(f"Executable file found: {rel_path}")
+class FabPluginNoExecutablesValidator(IFileValidator):
+    """Validates executable files in plugin."""
+    name = "Executable Files Validation"
 
-        return ValidationResult(
-            name="Executable Files Validation",
-            success=len(errors) == 0,
-            errors=errors,
-            warnings=[]
-        )
+    def check_file(self, entry: os.DirEntry, rel_path: str) -> Optional[str]:
+        """Check if the file is an executable."""
+        if _EXECUTABLE_RE.match(entry.name) is not None:
+            return f"Executable file found: {rel_path}"
+        return None
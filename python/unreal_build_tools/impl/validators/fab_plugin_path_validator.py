@@ -1,37 +1,21 @@
-from pathlib import Path
-from typing import List
-from unreal_build_tools.interfaces.validator import IValidator
-from unreal_build_tools.core.structs import ValidationResult, PluginInfo
+import os
+from typing import Optional
+from unreal_build_tools.interfaces.validator import IFileValidator
+from unreal_build_tools.core.structs import PluginInfo
 from unreal_build_tools.core.constants import MAX_PATH_LENGTH
 
-class FabPluginPathValidator(IValidator):
+class FabPluginPathValidator(IFileValidator):
     """Validates path lengths in plugin files."""
+    name = "Path Length Validation"
 
-    def validate(self) -> ValidationResult:
-        """Check if any file paths exceed maximum length.
-        
-        Returns:
-            ValidationResult: Contains validation status and any errors
-        """
-        errors: List[str] = []
-        source_dir = self.plugin_info.source_dir
-        plugin_name = source_dir.name
-        
-        for filepath in source_dir.rglob('*'):
-            if not filepath.is_file():
-                continue
-                
-            rel_path = str(filepath.relative_to(source_dir))
-            full_path = str(Path(plugin_name) / rel_path)
-            
-            if len(full_path) > MAX_PATH_LENGTH:
-                errors.append(
-                    f"Path exceeds {MAX_PATH_LENGTH} characters: {rel_path}"
-                )
+    def __init__(self, plugin_info: PluginInfo):
+        super().__init__(plugin_info)
+        # Packaged paths are prefixed with the plugin directory and a
+        # separator, so relative paths get the remaining budget
+        self._max_rel_length = MAX_PATH_LENGTH - len(plugin_info.source_dir.name) - 1
 
-        return ValidationResult(
-            name="Path Length Validation",
-            success=len(errors) == 0,
-            errors=errors,
-            warnings=[]
-        )
+    def check_file(self, entry: os.DirEntry, rel_path: str) -> Optional[str]:
+        """Check if the file's packaged path exceeds the maximum length."""
+        if len(rel_path) > self._max_rel_length:
+            return f"Path exceeds {MAX_PATH_LENGTH} characters: {rel_path}"
+        return None
@@ -1,10 +1,11 @@
-import json
 import re
 from typing import List
 from unreal_build_tools.interfaces.validator import IValidator
 from unreal_build_tools.core.structs import ValidationResult, PluginInfo
 from unreal_build_tools.core.constants import FAB_URL_PATTERN
 
+_FAB_URL_RE = re.compile(FAB_URL_PATTERN, re.IGNORECASE)
+
 class FabPluginUpluginValidator(IValidator):
     """Validates the .uplugin file content."""
 
@@ -15,15 +16,13 @@ class FabPluginUpluginValidator(IValidator):
             ValidationResult: Contains validation status and any errors
         """
         errors: List[str] = []
-        uplugin_path = self.plugin_info.uplugin_file
         
         try:
-            with uplugin_path.open('r') as f:
-                data = json.load(f)
+            data = self.plugin_info.plugin_data
             
             if 'FabURL' not in data:
                 errors.append("Missing 'FabURL' field in .uplugin file")
-            elif not data['FabURL'] or not re.search(FAB_URL_PATTERN, data['FabURL'], re.I):
+            elif not data['FabURL'] or not _FAB_URL_RE.search(data['FabURL']):
                 errors.append(f"Invalid 'FabURL' value: {data.get('FabURL')}")
                 
         except Exception as e:
@@ -0,0 +1,56 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import List, Optional, Sequence, Union
+from unreal_build_tools.interfaces.validator import IFileValidator
+from unreal_build_tools.core.filesystem import iter_files
+from unreal_build_tools.core.constants import IO_WORKERS
+from unreal_build_tools.core.structs import ValidationResult, PluginInfo
+
+class FusedFileValidator:
+    """Runs several per-file validators from a single walk of the plugin.
+
+    Every file is visited once and handed to each validator that applies
+    to it. Checks that read files are run on a thread pool while the walk
+    carries on; the rest run inline.
+    """
+
+    def __init__(self, plugin_info: PluginInfo, validators: Sequence[IFileValidator]):
+        """Initialize with the validators to drive.
+
+        Args:
+            plugin_info (PluginInfo): Plugin to validate
+            validators (Sequence[IFileValidator]): Validators for plugin_info
+        """
+        self.plugin_info = plugin_info
+        self.validators = list(validators)
+
+    def validate(self) -> List[ValidationResult]:
+        """Run every validator over the plugin's files.
+
+        Returns:
+            List[ValidationResult]: One result per validator, in order
+        """
+        # Errors are kept in walk order, pooled checks as futures
+        outcomes: List[List[Union[str, Future]]] = [[] for _ in self.validators]
+        with ThreadPoolExecutor(max_workers=IO_WORKERS) as executor:
+            for entry, rel_path in iter_files(self.plugin_info.source_dir):
+                for validator, validator_outcomes in zip(self.validators, outcomes):
+                    if not validator.applies_to(entry, rel_path):
+                        continue
+                    if validator.reads_files:
+                        validator_outcomes.append(
+                            executor.submit(validator.check_file, entry, rel_path)
+                        )
+                    else:
+                        error = validator.check_file(entry, rel_path)
+                        if error is not None:
+                            validator_outcomes.append(error)
+
+        results = []
+        for validator, validator_outcomes in zip(self.validators, outcomes):
+            errors: List[str] = []
+            for outcome in validator_outcomes:
+                error: Optional[str] = outcome.result() if isinstance(outcome, Future) else outcome
+                if error is not None:
+                    errors.append(error)
+            results.append(validator.make_result(errors))
+        return results
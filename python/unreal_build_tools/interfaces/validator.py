@@ -1,5 +1,8 @@
 from abc import ABC, abstractmethod
 from pathlib import Path
+from typing import List, Optional
+import os
+from unreal_build_tools.core.filesystem import iter_files
 from unreal_build_tools.core.structs import ValidationResult, PluginInfo
 
 class IValidator(ABC):
@@ -21,3 +24,55 @@ class IValidator(ABC):
             ValidationResult containing validation status and any errors/warnings
         """
         pass
+
+
+class IFileValidator(IValidator):
+    """Interface for validators that check each plugin file independently.
+    
+    Implementations only provide the per-file check, so several of them
+    can be driven from a single walk of the plugin (see FusedFileValidator).
+    """
+    # Name reported in the ValidationResult
+    name: str = ""
+    # Set when check_file reads the file, so drivers can run it on threads
+    reads_files: bool = False
+    
+    def applies_to(self, entry: os.DirEntry, rel_path: str) -> bool:
+        """Cheap pre-filter deciding whether check_file is needed for a file."""
+        return True
+    
+    @abstractmethod
+    def check_file(self, entry: os.DirEntry, rel_path: str) -> Optional[str]:
+        """Check a single file.
+        
+        Args:
+            entry: Directory entry of the file
+            rel_path: Path of the file relative to the plugin root
+        
+        Returns:
+            Error message, or None if the file passes
+        """
+        pass
+    
+    def make_result(self, errors: List[str]) -> ValidationResult:
+        """Build the ValidationResult for a list of errors."""
+        return ValidationResult(
+            name=self.name,
+            success=len(errors) == 0,
+            errors=errors,
+            warnings=[]
+        )
+    
+    def validate(self) -> ValidationResult:
+        """Run check_file on every applicable file in the plugin.
+        
+        Returns:
+            ValidationResult containing validation status and any errors
+        """
+        errors: List[str] = []
+        for entry, rel_path in iter_files(self.plugin_info.source_dir):
+            if self.applies_to(entry, rel_path):
+                error = self.check_file(entry, rel_path)
+                if error is not None:
+                    errors.append(error)
+        return self.make_result(errors)
@@ -1,55 +1,258 @@
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import json
+import os
+import queue
+import re
+import threading
 from pathlib import Path
 import shutil
+import zipfile
+from typing import Iterator, List, Optional, Tuple
+from .core import jsonio
+from .core.constants import IO_WORKERS, STORED_FILE_EXTENSIONS
 from .core.filesystem import temporary_directory
 from .core.logging import setup_logger
 
 logger = setup_logger(__name__)
 
+# Larger files are left to zipfile to stream instead of being read whole
+_PREFETCH_MAX_SIZE = 16 * 1024 * 1024
+# Entries the archive walker and readers may run ahead of the writer
+_ARCHIVE_QUEUE_SIZE = 64
+# Stands in for EngineVersion in the serialized .uplugin template
+_VERSION_PLACEHOLDER = '"__PKGVER__"'
+# An existing "EngineVersion": "..." entry, the value may hold escapes
+_ENGINE_VERSION_RE = re.compile(rb'(?P<key>"EngineVersion"\s*:\s*)"(?:[^"\\]|\\.)*"')
+
+def build_uplugin_template(uplugin_path: Path) -> bytes:
+    """Build a .uplugin template with a placeholder for EngineVersion.
+
+    Only EngineVersion differs between the packaged versions, so each
+    version just substitutes its value into these bytes. The existing value
+    is swapped out in the raw file, which keeps the author's formatting and
+    skips a parse and dump. Descriptors without the key are reserialized
+    with it added.
+
+    Args:
+        uplugin_path (Path): .uplugin file to read
+
+    Returns:
+        bytes: Encoded JSON with EngineVersion set to the placeholder
+    """
+    raw = uplugin_path.read_bytes()
+    template, count = _ENGINE_VERSION_RE.subn(
+        b'\\g<key>' + _VERSION_PLACEHOLDER.encode(), raw, count=1
+    )
+    if count:
+        return template
+
+    uplugin_data = jsonio.loads(raw)
+    uplugin_data['EngineVersion'] = json.loads(_VERSION_PLACEHOLDER)
+    return jsonio.dumps(uplugin_data)
+
+def _render_uplugin(template: bytes, version: str) -> bytes:
+    """Fill a template from build_uplugin_template for one UE version."""
+    if version.count('.') == 1:
+        version = f"{version}.0"
+    return template.replace(_VERSION_PLACEHOLDER.encode(), json.dumps(version).encode(), 1)
+
+def _read_entry(path: str, arcname: str) -> Tuple[zipfile.ZipInfo, bytes]:
+    """Stat and read one file for the archive, off the writing thread.
+
+    Only the I/O happens here, the writer compresses the contents.
+
+    Returns:
+        Tuple[zipfile.ZipInfo, bytes]: Entry info set up for deflate, and
+            the file contents
+    """
+    zinfo = zipfile.ZipInfo.from_file(path, arcname)
+    zinfo.compress_type = zipfile.ZIP_DEFLATED
+    with open(path, 'rb') as f:
+        return zinfo, f.read()
+
+def _iter_archive_entries(
+    staged_plugin_dir: Path
+) -> Iterator[Tuple[str, str, Optional[int], bool]]:
+    """Walk a staged plugin in archive order.
+
+    Yields:
+        Tuple[str, str, Optional[int], bool]: Path, archive name, compression
+            for ZipFile.write (None for the archive default), and whether the
+            file should be read ahead on the thread pool instead
+    """
+    plugin_name = staged_plugin_dir.name
+    uplugin_path = os.fspath(next(staged_plugin_dir.glob("*.uplugin")))
+    source_dir = os.fspath(staged_plugin_dir)
+    # os.walk roots all start with source_dir, so slicing gives the
+    # relative part without building Path objects
+    prefix_length = len(source_dir)
+
+    yield source_dir, plugin_name, None, False
+    for root, dirnames, filenames in os.walk(source_dir):
+        arc_root = plugin_name + root[prefix_length:].replace(os.sep, '/') + '/'
+        for name in sorted(dirnames):
+            yield os.path.join(root, name), arc_root + name, None, False
+        for name in sorted(filenames):
+            path = os.path.join(root, name)
+            if path == uplugin_path:
+                continue
+            if name.lower().endswith(STORED_FILE_EXTENSIONS):
+                yield path, arc_root + name, zipfile.ZIP_STORED, False
+            elif os.path.getsize(path) > _PREFETCH_MAX_SIZE:
+                # Streamed by zipfile rather than read whole into memory
+                yield path, arc_root + name, None, False
+            else:
+                yield path, arc_root + name, None, True
+
+def build_base_archive(staged_plugin_dir: Path, archive_path: Path) -> None:
+    """Compress every staged file except the .uplugin into a zip archive.
+
+    Only the .uplugin differs between engine versions, so the rest of the
+    plugin is compressed once and the archive reused for each version.
+    Entries are laid out the same way shutil.make_archive would, under a
+    top level directory named after the plugin. Files that are already
+    compressed are stored as is.
+
+    The work runs as a walker/reader/writer read-ahead pipeline, so file
+    I/O overlaps compression. The walker thread submits files to a pool of
+    reader threads that stat and read them, and queues them in walk order.
+    The writer, this thread, compresses and writes each entry through
+    ZipFile.writestr as soon as its contents are in memory. The
+    bounded queue limits how many files are held in memory at once.
+
+    Deflate itself runs serially on this thread. zipfile has no public way
+    to add an entry that was compressed elsewhere, so the pool only reads
+    ahead and compression is not spread across threads.
+
+    Args:
+        staged_plugin_dir (Path): Staged plugin directory
+        archive_path (Path): Zip file to create
+    """
+    entries = queue.Queue(maxsize=_ARCHIVE_QUEUE_SIZE)
+    stop = threading.Event()
+
+    with zipfile.ZipFile(archive_path, 'w', zipfile.ZIP_DEFLATED) as zf, \
+            ThreadPoolExecutor(max_workers=IO_WORKERS) as executor:
+
+        def walk():
+            try:
+                for path, arcname, compress_type, prefetch in _iter_archive_entries(staged_plugin_dir):
+                    if stop.is_set():
+                        return
+                    future = executor.submit(_read_entry, path, arcname) if prefetch else None
+                    entries.put((path, arcname, compress_type, future))
+            except BaseException as e:
+                entries.put(e)
+                return
+            entries.put(None)
+
+        walker = threading.Thread(target=walk, name="archive-walker", daemon=True)
+        walker.start()
+        try:
+            while True:
+                item = entries.get()
+                if item is None:
+                    break
+                if isinstance(item, BaseException):
+                    raise item
+                path, arcname, compress_type, future = item
+                if future is None:
+                    zf.write(path, arcname, compress_type)
+                else:
+                    zf.writestr(*future.result())
+        finally:
+            stop.set()
+            # The walker may be blocked on a full queue if writing failed
+            while walker.is_alive():
+                try:
+                    entries.get_nowait()
+                except queue.Empty:
+                    walker.join(0.05)
+
 def package_version_for_fab(
     staged_plugin_dir: Path,
     version: str,
-    output_dir: Path
+    output_dir: Path,
+    base_archive: Optional[Path] = None,
+    uplugin_template: Optional[bytes] = None
 ) -> None:
     """Package plugin for specific UE version from staged files.
-    
+
+    Args:
+        staged_plugin_dir (Path): Staged plugin directory
+        version (str): UE version to package for
+        output_dir (Path): Directory to write the zip file to
+        base_archive (Optional[Path], optional): Archive from build_base_archive
+            to reuse. Defaults to None, which builds one for this call.
+        uplugin_template (Optional[bytes], optional): Output of
+            build_uplugin_template to reuse. Defaults to None, which reads
+            the staged .uplugin.
+
+    Raises:
+        ConfigurationError: If plugin files are invalid
+        RuntimeError: If packaging operation fails
+    """
+    if base_archive is None:
+        with temporary_directory() as temp_dir:
+            base_archive = temp_dir / "base.zip"
+            build_base_archive(staged_plugin_dir, base_archive)
+            package_version_for_fab(
+                staged_plugin_dir, version, output_dir, base_archive, uplugin_template
+            )
+        return
+
+    plugin_name = staged_plugin_dir.name
+
+    # Update plugin version
+    uplugin_path = next(staged_plugin_dir.glob("*.uplugin"))
+    if uplugin_template is None:
+        uplugin_template = build_uplugin_template(uplugin_path)
+
+    # Create zip archive from the shared base plus this version's .uplugin
+    zip_path = output_dir / f"{plugin_name}_UE{version}.zip"
+    shutil.copyfile(base_archive, zip_path)
+
+    zinfo = zipfile.ZipInfo.from_file(uplugin_path, f"{plugin_name}/{uplugin_path.name}")
+    zinfo.compress_type = zipfile.ZIP_DEFLATED
+    with zipfile.ZipFile(zip_path, 'a') as zf:
+        zf.writestr(zinfo, _render_uplugin(uplugin_template, version))
+
+    logger.info("Created package: %s", zip_path)
+
+def package_versions_for_fab(
+    staged_plugin_dir: Path,
+    versions: List[str],
+    output_dir: Path
+) -> None:
+    """Package plugin for each UE version, compressing shared files once.
+
+    After the shared archive is built, each version only needs a file copy
+    and one small append, which are I/O bound, so versions are written in
+    parallel on threads.
+
     Raises:
         ConfigurationError: If plugin files are invalid
         RuntimeError: If packaging operation fails
     """
     with temporary_directory() as temp_dir:
-        # Create version directory
-        version_dir = temp_dir / f"UE{version}"
-        version_dir.mkdir()
-        
-        # Copy staged files to version directory
-        plugin_name = staged_plugin_dir.name
-        plugin_dir = version_dir / plugin_name
-        shutil.copytree(staged_plugin_dir, plugin_dir)
-        
-        # Update plugin version
-        uplugin_path = next(plugin_dir.glob("*.uplugin"))
-        with uplugin_path.open('r') as f:
-            uplugin_data = json.load(f)
-        
-        if version.count('.') == 1:
-            uplugin_data['EngineVersion'] = f"{version}.0"
-        else:
-            uplugin_data['EngineVersion'] = version
-            
-        with uplugin_path.open('w') as f:
-            json.dump(uplugin_data, f, indent=2)
-        
-        # Create zip archive
-        zip_path = output_dir / f"{plugin_name}_UE{version}.zip"
-        if zip_path.exists():
-            zip_path.unlink()
-        
-        shutil.make_archive(
-            str(zip_path.with_suffix('')),
-            'zip',
-            root_dir=str(version_dir),
-            base_dir=plugin_name
-        )
-        
-        logger.info(f"Created package: {zip_path}")
\ No newline at end of file
+        base_archive = temp_dir / "base.zip"
+        build_base_archive(staged_plugin_dir, base_archive)
+        uplugin_template = build_uplugin_template(next(staged_plugin_dir.glob("*.uplugin")))
+        max_workers = max(1, min(len(versions), os.cpu_count() or 1))
+
+        def package_version(version: str) -> None:
+            # Logged by the worker, so it shows when this version starts
+            logger.info("\nPackaging for UE %s...", version)
+            package_version_for_fab(
+                staged_plugin_dir, version, output_dir, base_archive, uplugin_template
+            )
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(package_version, version): version for version in versions}
+            # Report each version as it finishes, raising the first failure
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except Exception:
+                    logger.error("Packaging failed for UE %s", futures[future])
+                    raise
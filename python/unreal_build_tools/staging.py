@@ -1,55 +1,142 @@
 """Module for staging Unreal Engine plugin files for packaging.
 
-This module handles copying and filtering plugin files according to 
+This module handles copying and filtering plugin files according to
 FilterPlugin.ini configuration for preparation before packaging.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Iterator, Optional, Tuple
+import os
 import shutil
 import logging
 
+from .core.constants import IO_WORKERS
+from .core.filesystem import copy_file
 from .core.structs import PluginInfo
-from .core.filter_config import parse_filter_config
+from .core.filter_config import FilterMatcher, compile_filter, parse_filter_config
 
 logger = logging.getLogger(__name__)
 
-def resolve_glob_pattern(base_dir: Path, pattern: str) -> set[Path]:
-    """Resolve a glob pattern against a base directory."""
-    if pattern.startswith('/'):
-        pattern = pattern[1:]
-    pattern = pattern.replace('\\', '/')
-    
-    matched = set()
-    for path in base_dir.glob(pattern):
-        if path.is_file():
-            # resolve() will return the actual case-sensitive path from the filesystem
-            matched.add(path.resolve())
-    
-    return matched
-
-def stage_plugin_files(plugin_info: PluginInfo, staging_dir: Path, verbose: bool = False) -> Path:
-    """Copy filtered plugin files to staging directory."""
-    include_patterns = parse_filter_config(plugin_info.source_dir)
+def iter_included_files(
+    source_dir: Path,
+    matcher: FilterMatcher
+) -> Iterator[Tuple[os.DirEntry, str]]:
+    """Walk source_dir once, yielding files included by the filter.
+
+    Directories that no pattern can reach are never listed.
+
+    Args:
+        source_dir (Path): Plugin root directory
+        matcher (FilterMatcher): Compiled include patterns
+
+    Yields:
+        Tuple[os.DirEntry, str]: Directory entry and its '/' separated
+            path relative to source_dir
+    """
+    stack = [(os.fspath(source_dir), '')]
+    while stack:
+        abs_dir, rel_dir = stack.pop()
+        with os.scandir(abs_dir) as entries:
+            for entry in entries:
+                rel_path = rel_dir + entry.name
+                rel_lower = rel_path.lower()
+                if entry.is_dir():
+                    if matcher.can_contain_match(rel_lower):
+                        stack.append((entry.path, rel_path + '/'))
+                elif matcher.match_file(rel_lower):
+                    yield entry, rel_path
+
+def _iter_copy_targets(
+    source_dir: Path,
+    matcher: FilterMatcher,
+    target_dir: Path
+) -> Iterator[Tuple[os.DirEntry, str, str]]:
+    """Yield included files with their destination, creating its parents.
+
+    Args:
+        source_dir (Path): Plugin root directory
+        matcher (FilterMatcher): Compiled include patterns
+        target_dir (Path): Directory the files are copied into
+
+    Yields:
+        Tuple[os.DirEntry, str, str]: Directory entry, destination path and
+            '/' separated path relative to source_dir
+    """
+    target_root = os.fspath(target_dir)
+    # The walk already gives relative paths as strings, so destinations are
+    # a plain concatenation with no Path objects or joins per file
+    target_prefix = target_root + os.sep
+    created_dirs = {target_root}
+    for entry, rel_path in iter_included_files(source_dir, matcher):
+        dst = target_prefix + rel_path
+        # Parents are created here, on the walking thread, so copy workers
+        # never race each other on mkdir
+        parent = os.path.dirname(dst)
+        if parent not in created_dirs:
+            os.makedirs(parent, exist_ok=True)
+            created_dirs.add(parent)
+        yield entry, dst, rel_path
+
+def stage_plugin_files(
+    plugin_info: PluginInfo,
+    staging_dir: Path,
+    verbose: bool = False,
+    matcher: Optional[FilterMatcher] = None,
+    max_workers: Optional[int] = None
+) -> Path:
+    """Copy filtered plugin files to staging directory.
+
+    Args:
+        plugin_info (PluginInfo): Plugin to stage
+        staging_dir (Path): Directory to stage the plugin into
+        verbose (bool, optional): Log patterns and copied files. Defaults to False.
+        matcher (Optional[FilterMatcher], optional): Compiled FilterPlugin.ini
+            patterns. Defaults to None, which parses the plugin's config.
+        max_workers (Optional[int], optional): Number of copy threads, 1 copies
+            serially. Defaults to None, which uses IO_WORKERS.
+
+    Returns:
+        Path: Staged plugin directory
+    """
+    if matcher is None:
+        matcher = compile_filter(parse_filter_config(plugin_info.source_dir))
     target_dir = staging_dir / plugin_info.source_dir.name
-    
-    if verbose:
+
+    # Checked once, so the per-file loop below costs nothing when the
+    # copied files are not going to be shown
+    log_copies = verbose and logger.isEnabledFor(logging.INFO)
+    if log_copies:
         logger.info("Include patterns:")
-        for pattern in include_patterns:
-            logger.info(f"  {pattern}")
-    
+        for pattern in matcher.patterns:
+            logger.info("  %s", pattern)
+
     target_dir.mkdir(parents=True)
     shutil.copy2(plugin_info.uplugin_file, target_dir / plugin_info.uplugin_file.name)
-    
-    included_files = set()
-    for pattern in include_patterns:
-        included_files.update(resolve_glob_pattern(plugin_info.source_dir, pattern))
-    
-    for path in included_files:
-        src_path = plugin_info.source_dir / path.relative_to(plugin_info.source_dir)
-        dst_path = target_dir / path.relative_to(plugin_info.source_dir)
-        dst_path.parent.mkdir(parents=True, exist_ok=True)
-        shutil.copy2(src_path, dst_path)
-        if verbose:
-            logger.info(f"Copied: {path.relative_to(plugin_info.source_dir)}")
-    
+
+    if max_workers is None:
+        max_workers = IO_WORKERS
+    copies = _iter_copy_targets(plugin_info.source_dir, matcher, target_dir)
+    if max_workers == 1:
+        # Serial staging copies in walk order on this thread, with no pool
+        for entry, dst, rel_path in copies:
+            copy_file(entry, dst)
+            if log_copies:
+                logger.info("Copied: %s", rel_path)
+        return target_dir
+
+    # Copies are syscall bound and release the GIL, so they are handed to
+    # a thread pool as soon as the walk finds them
+    futures = []
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for entry, dst, rel_path in copies:
+            # Given the DirEntry, shutil reuses its cached stat for copystat
+            futures.append((executor.submit(copy_file, entry, dst), rel_path))
+        # Collect the results so any copy failure is raised here, and only
+        # report a file once its copy has actually finished
+        for future, rel_path in futures:
+            future.result()
+            if log_copies:
+                logger.info("Copied: %s", rel_path)
+
     return target_dir
@@ -1,23 +1,60 @@
 from PySide6 import QtCore
-import os
-
-from unreal_build_tools.ui.icon_finder.constants import RelativePathRole
 
 class IconFilterModel(QtCore.QSortFilterProxyModel):
     def __init__(self, parent=None):
         super().__init__(parent)
         self._filter_text = ""
+        # One byte per source row, set when the row matches the filter text.
+        # Rows past the end have not been checked yet.
+        self._matches = bytearray()
         self.setDynamicSortFilter(True)
-        
+
+    def setSourceModel(self, model):
+        old_model = self.sourceModel()
+        if old_model is not None:
+            for signal in self._invalidating_signals(old_model):
+                signal.disconnect(self._clear_matches)
+        self._matches = bytearray()
+        if model is not None:
+            # Connected before the proxy's own handlers so they run first and
+            # the proxy never refilters against rows that have shifted
+            for signal in self._invalidating_signals(model):
+                signal.connect(self._clear_matches)
+        super().setSourceModel(model)
+
+    @staticmethod
+    def _invalidating_signals(model):
+        """Source signals after which the cached matches no longer line up"""
+        return (model.modelAboutToBeReset, model.rowsRemoved, model.layoutChanged)
+
+    @QtCore.Slot()
+    def _clear_matches(self):
+        self._matches = bytearray()
+
     @QtCore.Slot(str)
     def setFilterText(self, text):
-        self._filter_text = text.lower()
+        text = text.lower()
+        if self._filter_text and self._filter_text in text:
+            # A row that does not contain the old text cannot contain text
+            # that extends it, so only the rows still matching are rechecked
+            names = self.sourceModel().basenames_lower()
+            matches = self._matches
+            for row in range(len(matches)):
+                if matches[row] and text not in names[row]:
+                    matches[row] = 0
+        else:
+            self._matches = bytearray()
+        self._filter_text = text
         self.invalidateFilter()
     
     def filterAcceptsRow(self, source_row, source_parent):
         if not self._filter_text:
             return True
-            
-        source_index = self.sourceModel().index(source_row, 0, source_parent)
-        item_path = self.sourceModel().data(source_index, RelativePathRole)
-        return self._filter_text in os.path.basename(item_path).lower()
+
+        matches = self._matches
+        if source_row >= len(matches):
+            # Read the precomputed names directly rather than through data()
+            text = self._filter_text
+            names = self.sourceModel().basenames_lower()
+            matches.extend(text in name for name in names[len(matches):source_row + 1])
+        return bool(matches[source_row])
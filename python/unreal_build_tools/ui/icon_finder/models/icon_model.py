@@ -1,13 +1,68 @@
 from PySide6 import QtCore
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 import os
-import sys
+from unreal_build_tools.core.platform_utils import get_ue_versions
 from unreal_build_tools.ui.icon_finder.constants import RelativePathRole
 
+# Rows added to the view per event loop pass while icons stream in
+_INSERT_BATCH_SIZE = 500
+
+def _collect_icons(version_path, extensions):
+    """Collect icon paths relative to a single version's Slate directory"""
+    icon_paths = set()
+    if not os.path.isdir(version_path):
+        return icon_paths
+    stack = [(version_path, '')]
+    while stack:
+        abs_dir, rel_dir = stack.pop()
+        with os.scandir(abs_dir) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    # '/' on every platform, so sorting groups directories
+                    # the same way everywhere. The QML joins paths with '/'.
+                    stack.append((entry.path, rel_dir + entry.name + '/'))
+                elif entry.name.lower().endswith(extensions):
+                    icon_paths.add(rel_dir + entry.name)
+    return icon_paths
+
+def _find_common_icons(version_paths, icon_types):
+    """Sorted relative icon paths present in every version path"""
+    # Built once for every walk. One suffix test per name covers every icon
+    # type, matched regardless of case the way rglob does on Windows
+    extensions = tuple(f'.{ext.lower()}' for ext in icon_types)
+    # scandir is filesystem bound and releases the GIL, so every version
+    # tree is walked at the same time
+    with ThreadPoolExecutor(max_workers=min(32, len(version_paths))) as executor:
+        futures = [
+            executor.submit(_collect_icons, version_path, extensions)
+            for version_path in version_paths
+        ]
+        icon_paths = futures[0].result()
+        for future in futures[1:]:
+            icon_paths.intersection_update(future.result())
+    return sorted(icon_paths)
+
+class _IconLoaderSignals(QtCore.QObject):
+    finished = QtCore.Signal(list)
+
+class _IconLoader(QtCore.QRunnable):
+    """Finds the common icons off the UI thread"""
+    def __init__(self, version_paths, icon_types, signals):
+        super().__init__()
+        self.signals = signals
+        self.version_paths = version_paths
+        self.icon_types = icon_types
+
+    def run(self):
+        self.signals.finished.emit(_find_common_icons(self.version_paths, self.icon_types))
+
 class IconModel(QtCore.QAbstractListModel):
     def __init__(self, versions, base_path, sub_path, icon_types, parent=None):
         super().__init__(parent)
         self._icons = []
+        self._basenames_lower = []
+        self._pending_icons = []
+        self._loader_signals = None
         self.versions = versions
         self.base_path = base_path
         self.icon_types = icon_types
@@ -29,35 +84,84 @@ class IconModel(QtCore.QAbstractListModel):
             
         if 0 <= index.row() < self.rowCount():
             if role == QtCore.Qt.DisplayRole:
-                return str(self._icons[index.row()])
+                return self._icons[index.row()]
             elif role == RelativePathRole:
-                return str(self._icons[index.row()])
+                return self._icons[index.row()]
         return None
     
     def load_icons(self):
-        """Load only relative paths that exist in all UE versions"""
-        version_paths = []
-        for version in self.versions:
-            if sys.platform == 'darwin':
-                version_path = Path(self.base_path) / f"UE_{version}" / self.sub_path
-            else:
-                version_path = Path(self.base_path) / f"UE_{version}" / self.sub_path
-            version_paths.append(version_path)
-
-        if not all(p.exists() for p in version_paths):
+        """Start loading the relative paths that exist in all UE versions.
+
+        The version trees are walked on a background thread and the rows
+        are added in batches once it finishes, so the window stays responsive.
+        """
+        if self._icons:
+            self.beginResetModel()
+            self._icons = []
+            self._basenames_lower = []
+            self.endResetModel()
+        self._pending_icons = []
+        if self._loader_signals is not None:
+            # Results from an earlier load that is still running are stale.
+            # Its runnable may still emit, so the signals object is only
+            # deleted once it has.
+            stale_signals = self._loader_signals
+            stale_signals.finished.disconnect(self._on_icons_loaded)
+            stale_signals.finished.connect(stale_signals.deleteLater)
+            self._loader_signals = None
+
+        # The install listing is cached and shared with version discovery, so
+        # checking against it costs no extra stats. A version without a Slate
+        # directory yields no icons, which empties the intersection.
+        try:
+            installed = set(get_ue_versions(self.base_path))
+        except OSError:
             return
-            
-        first_version = version_paths[0]
-        icon_paths = set()
-        for pattern in [f'*.{ext}' for ext in self.icon_types]:
-            for icon_file in first_version.rglob(pattern):
-                icon_paths.add(icon_file.relative_to(first_version))
-        
-        for version_path in version_paths[1:]:
-            existing_paths = set()
-            for pattern in [f'*.{ext}' for ext in self.icon_types]:
-                for icon_file in version_path.rglob(pattern):
-                    existing_paths.add(icon_file.relative_to(version_path))
-            icon_paths.intersection_update(existing_paths)
-        
-        self._icons = sorted(icon_paths)
\ No newline at end of file
+        if not self.versions or not installed.issuperset(self.versions):
+            return
+
+        version_paths = [
+            os.path.join(self.base_path, f"UE_{version}", self.sub_path)
+            for version in self.versions
+        ]
+
+        # The pool owns and deletes the runnable once run() returns. The
+        # signals object is parented to the model instead, so it stays alive
+        # for as long as a running load may still emit from it.
+        self._loader_signals = _IconLoaderSignals(self)
+        self._loader_signals.finished.connect(self._on_icons_loaded)
+        QtCore.QThreadPool.globalInstance().start(
+            _IconLoader(version_paths, self.icon_types, self._loader_signals)
+        )
+
+    @QtCore.Slot(list)
+    def _on_icons_loaded(self, icons):
+        # A result queued before its load was replaced is still delivered
+        if self.sender() is not self._loader_signals:
+            return
+        self._loader_signals.deleteLater()
+        self._loader_signals = None
+        self._pending_icons = icons
+        self._insert_next_batch()
+
+    def _insert_next_batch(self):
+        batch = self._pending_icons[:_INSERT_BATCH_SIZE]
+        del self._pending_icons[:_INSERT_BATCH_SIZE]
+        if not batch:
+            return
+
+        first = len(self._icons)
+        self.beginInsertRows(QtCore.QModelIndex(), first, first + len(batch) - 1)
+        self._icons.extend(batch)
+        # Filtering matches on these for every row per keystroke, so they
+        # are worked out once here
+        self._basenames_lower.extend(os.path.basename(path).lower() for path in batch)
+        self.endInsertRows()
+
+        if self._pending_icons:
+            # Let the view paint before the next batch goes in
+            QtCore.QTimer.singleShot(0, self._insert_next_batch)
+
+    def basenames_lower(self):
+        """Lowercase icon file names, indexed by row"""
+        return self._basenames_lower